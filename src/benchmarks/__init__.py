@@ -0,0 +1,12 @@
+"""Benchmark suite timing repository calls and screen data paths on generated databases."""
+from .datasets import dataset_path, working_copy
+from .suite import BENCHMARKS, run_suite
+from .compare import compare_results
+
+__all__ = [
+    'dataset_path',
+    'working_copy',
+    'BENCHMARKS',
+    'run_suite',
+    'compare_results'
+]
@@ -0,0 +1,49 @@
+"""Command line entry: python -m benchmarks run|compare (from the src directory)."""
+import argparse
+import json
+import sys
+
+from .compare import compare_results
+from .suite import BENCHMARKS, run_suite
+
+
+def main(argv=None) -> int:
+    """Parse arguments and run or compare benchmarks; returns the exit status."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description="Repository and screen data benchmarks.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="time benchmarks and save the results as JSON")
+    run.add_argument("--sizes", type=int, nargs='+', default=[1_000, 10_000, 100_000], help="offers per generated database")
+    run.add_argument("--only", nargs='+', default=[], choices=sorted(BENCHMARKS), metavar='NAME', help="benchmarks to run")
+    run.add_argument("--rounds", type=int, default=5, help="timed rounds per benchmark")
+    run.add_argument("--seed", type=int, default=42, help="dataset and workload seed")
+    run.add_argument("--out", default='benchmark-results.json', help="results file")
+
+    compare = commands.add_parser('compare', help="compare two results files; exits 1 on regressions")
+    compare.add_argument("baseline", help="results of the reference commit")
+    compare.add_argument("current", help="results to check")
+    compare.add_argument("--threshold", type=float, default=0.10, help="allowed median slowdown, 0.10 = 10%%")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run_suite(args.sizes, args.only, rounds=args.rounds, seed=args.seed)
+        with open(args.out, 'w', encoding='utf-8') as handle:
+            json.dump(results, handle, indent=2)
+        print(f"Saved {args.out}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as handle:
+        baseline = json.load(handle)
+    with open(args.current, encoding='utf-8') as handle:
+        current = json.load(handle)
+    lines, regressions = compare_results(baseline, current, args.threshold)
+    print('\n'.join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):\n  " + '\n  '.join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,29 @@
+"""Compare two benchmark result files and flag regressions."""
+from typing import Dict, List, Tuple
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = 0.10) -> Tuple[List[str], List[str]]:
+    """Return report lines and the regressions whose median slowed down by more than threshold."""
+    lines = [
+        f"baseline {baseline['environment']['commit']}  vs  current {current['environment']['commit']}",
+        f"{'offers':>10}  {'benchmark':<24} {'baseline us':>12} {'current us':>12} {'change':>8}"
+    ]
+    regressions = []
+    for size, benchmarks in current['results'].items():
+        for name, stats in benchmarks.items():
+            before = baseline['results'].get(size, {}).get(name)
+            if before is None:
+                lines.append(f"{int(size):>10,}  {name:<24} {'-':>12} {stats['median_us']:>12,.1f}      new")
+                continue
+            change = stats['median_us'] / before['median_us'] - 1
+            marker = ''
+            if change > threshold:
+                marker = '  REGRESSION'
+                regressions.append(f"{name} at {int(size):,} offers: {change:+.1%}")
+            elif change < -threshold:
+                marker = '  faster'
+            lines.append(
+                f"{int(size):>10,}  {name:<24} {before['median_us']:>12,.1f} "
+                f"{stats['median_us']:>12,.1f} {change:>+8.1%}{marker}"
+            )
+    return lines, regressions
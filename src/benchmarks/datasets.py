@@ -0,0 +1,30 @@
+"""Generated benchmark databases, cached per size and seed."""
+import os
+import shutil
+
+from generate_data import generate_database
+
+
+DATASETS_DIR = os.path.join('cache', 'benchmarks')
+
+
+def dataset_path(offers: int, seed: int = 42) -> str:
+    """Return the pristine database for a size and seed, generating it on first use."""
+    path = os.path.join(DATASETS_DIR, f"offers-{offers}-seed-{seed}.db")
+    if not os.path.exists(path):
+        os.makedirs(DATASETS_DIR, exist_ok=True)
+        # Generate under a temporary name so an interrupted run leaves no half dataset
+        partial = f"{path}.partial"
+        generate_database(partial, seed=seed, offers=offers)
+        os.replace(partial, path)
+    return path
+
+
+def working_copy(path: str) -> str:
+    """Copy a pristine dataset so write benchmarks never alter the cached original."""
+    copy = f"{path}.run"
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(copy + suffix):
+            os.remove(copy + suffix)
+    shutil.copyfile(path, copy)
+    return copy
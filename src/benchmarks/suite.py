@@ -0,0 +1,211 @@
+"""Benchmarked operations and the headless runner timing them."""
+import itertools
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import time
+from typing import Callable, Dict, Sequence
+
+from database import DatabaseConnection, get_db
+from models import Offer
+from repositories import ApplicationRepository, BaseRepository, OfferRepository
+
+from .datasets import dataset_path, working_copy
+
+
+class BenchContext:
+    """Repositories and id ranges of the database being benchmarked."""
+    
+    def __init__(self, seed: int):
+        """Initialize repositories and read table sizes from the current database."""
+        self.rng = random.Random(seed)
+        self.offer_repo = OfferRepository()
+        self.application_repo = ApplicationRepository()
+        with get_db() as conn:
+            self.max_offer_id = conn.execute("SELECT MAX(id) FROM offers").fetchone()[0]
+            self.max_company_id = conn.execute("SELECT MAX(id) FROM companies").fetchone()[0]
+            self.max_user_id = conn.execute("SELECT MAX(id) FROM users").fetchone()[0]
+            max_application_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM applications").fetchone()[0]
+            # Existing pairs, so lookups hit as they do when a user re-opens an offer
+            sample = self.rng.sample(range(1, max_application_id + 1), min(max_application_id, 500))
+            self.applications = conn.execute(
+                f"SELECT user_id, offer_id FROM applications WHERE id IN ({', '.join('?' * len(sample))})",
+                sample
+            ).fetchall()
+    
+    def offer_id(self) -> int:
+        """A random existing offer id."""
+        return self.rng.randint(1, self.max_offer_id)
+
+
+def bench_get_by_id(ctx: BenchContext) -> Callable:
+    """BaseRepository.get_by_id on random offers."""
+    return lambda: ctx.offer_repo.get_by_id(ctx.offer_id())
+
+
+def bench_get_all(ctx: BenchContext) -> Callable:
+    """BaseRepository.get_all over the whole offers table."""
+    return ctx.offer_repo.get_all
+
+
+def bench_create(ctx: BenchContext) -> Callable:
+    """BaseRepository.create of one offer per call."""
+    def create():
+        ctx.offer_repo.create(Offer(
+            id=0,
+            company_id=ctx.rng.randint(1, ctx.max_company_id),
+            title='Benchmark Engineer',
+            skill_tags='Python, SQL, Benchmarking',
+            salary=100000.0,
+            description='Created by the benchmark suite',
+            created_at=int(time.time())
+        ))
+    return create
+
+
+def bench_update(ctx: BenchContext) -> Callable:
+    """BaseRepository.update of a random offer's salary."""
+    # Loaded up front so the timed call measures only the write
+    offers = [offer for offer in (ctx.offer_repo.get_by_id(ctx.offer_id()) for _ in range(500)) if offer]
+    targets = itertools.cycle(offers)
+    
+    def update():
+        offer = next(targets)
+        offer.salary += 1000
+        ctx.offer_repo.update(offer)
+    return update
+
+
+def bench_get_by_user_and_offer(ctx: BenchContext) -> Callable:
+    """ApplicationRepository.get_by_user_and_offer for existing applications."""
+    pairs = ctx.applications or [(1, 1)]
+    return lambda: ctx.application_repo.get_by_user_and_offer(*ctx.rng.choice(pairs))
+
+
+def bench_get_by_company(ctx: BenchContext) -> Callable:
+    """OfferRepository.get_by_company; low ids are the big employers."""
+    return lambda: ctx.offer_repo.get_by_company(ctx.rng.randint(1, min(ctx.max_company_id, 20)))
+
+
+def bench_load_offers(ctx: BenchContext) -> Callable:
+    """Data half of OffersScreen.load_offers: the first unfiltered page."""
+    return lambda: ctx.offer_repo.page(limit=50)
+
+
+def bench_apply_filter(ctx: BenchContext) -> Callable:
+    """Data half of OffersScreen.apply_filter: a first page with every filter set."""
+    return lambda: ctx.offer_repo.page(
+        limit=50,
+        title='developer',
+        min_salary=80000,
+        max_salary=150000,
+        skills=['Python', 'SQL']
+    )
+
+
+def bench_load_applications(ctx: BenchContext) -> Callable:
+    """Data half of ApplicationsScreen.load_applications for a random user."""
+    return lambda: ctx.application_repo.get_detailed_by_user(ctx.rng.randint(1, ctx.max_user_id))
+
+
+# Benchmarks by name, in run order; writes come after the reads they would disturb
+BENCHMARKS: Dict[str, Callable[[BenchContext], Callable]] = {
+    'get_by_id': bench_get_by_id,
+    'get_all': bench_get_all,
+    'get_by_user_and_offer': bench_get_by_user_and_offer,
+    'get_by_company': bench_get_by_company,
+    'load_offers': bench_load_offers,
+    'apply_filter': bench_apply_filter,
+    'load_applications': bench_load_applications,
+    'create': bench_create,
+    'update': bench_update
+}
+
+
+def calls_per_round(operation: Callable, min_round_seconds: float) -> int:
+    """Find how many calls fill a round, like timeit's autorange; also warms caches."""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            operation()
+        if time.perf_counter() - started >= min_round_seconds:
+            return number
+        number *= 2
+
+
+def time_operation(operation: Callable, rounds: int, min_round_seconds: float = 0.2) -> Dict[str, float]:
+    """Time rounds of repeated calls; return per-call statistics in microseconds."""
+    number = calls_per_round(operation, min_round_seconds)
+    per_call = []
+    for _ in range(rounds):
+        started = time.perf_counter_ns()
+        for _ in range(number):
+            operation()
+        per_call.append((time.perf_counter_ns() - started) / number / 1000)
+    per_call.sort()
+    return {
+        'calls': number * rounds,
+        'min_us': per_call[0],
+        'median_us': statistics.median(per_call),
+        'mean_us': statistics.fmean(per_call),
+        'max_us': per_call[-1],
+        'stdev_us': statistics.stdev(per_call) if len(per_call) > 1 else 0.0
+    }
+
+
+def environment() -> Dict[str, str]:
+    """Describe where results came from, so comparisons across machines are visible."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = 'unknown'
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+
+def run_suite(
+    sizes: Sequence[int],
+    names: Sequence[str] = (),
+    rounds: int = 5,
+    seed: int = 42
+) -> Dict:
+    """Benchmark every selected operation against a generated database of each size."""
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+    selected = [name for name in BENCHMARKS if not names or name in names]
+
+    results: Dict[str, Dict] = {}
+    for size in sizes:
+        path = working_copy(dataset_path(size, seed))
+        DatabaseConnection.set_db_path(path)
+        # Entries cached from the previous database would fake fast lookups
+        for cache in BaseRepository._caches.values():
+            cache.clear()
+
+        ctx = BenchContext(seed)
+        results[str(size)] = {}
+        for name in selected:
+            stats = time_operation(BENCHMARKS[name](ctx), rounds)
+            results[str(size)][name] = stats
+            print(f"  {size:>10,} offers  {name:<24} {stats['median_us']:>12,.1f} us/call")
+
+        DatabaseConnection().close_all()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    return {'environment': environment(), 'rounds': rounds, 'seed': seed, 'results': results}
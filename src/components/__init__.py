@@ -1,4 +1,20 @@
 """Components package for reusable UI widgets and dialogs."""
-from .toast import Toast
+import importlib
 
-__all__ = ['Toast']
+# Components are imported on first access, so importing the package
+# doesn't pull in the KivyMD widgets they are built from
+_COMPONENT_MODULES = {
+    'Toast': '.toast',
+    'CardList': '.card_list'
+}
+
+__all__ = ['Toast', 'CardList']
+
+
+def __getattr__(name):
+    """Import a component module the first time its class is requested."""
+    if name in _COMPONENT_MODULES:
+        value = getattr(importlib.import_module(_COMPONENT_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
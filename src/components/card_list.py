@@ -0,0 +1,22 @@
+"""Virtualized vertical list that recycles a fixed pool of card widgets."""
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
+
+
+class CardList(RecycleView):
+    """RecycleView creating only enough cards for the visible area."""
+    
+    def __init__(self, viewclass, item_height: float, spacing: float = 10, **kwargs):
+        """Initialize list rendering data dicts through viewclass rows of fixed height."""
+        super().__init__(**kwargs)
+        self.viewclass = viewclass
+        
+        layout = RecycleBoxLayout(
+            orientation='vertical',
+            default_size=(None, item_height),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            spacing=spacing
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
@@ -1,4 +1,5 @@
 """Database package for SQLite connection and initialization."""
-from .connection import DatabaseConnection, get_db
+from .connection import DatabaseConnection, get_db, interruptible
+from .instrumentation import QueryStats
 
-__all__ = ['DatabaseConnection', 'get_db']
+__all__ = ['DatabaseConnection', 'get_db', 'interruptible', 'QueryStats']
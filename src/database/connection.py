@@ -1,49 +1,108 @@
 """Database connection management using SQLite singleton pattern."""
 import sqlite3
+import threading
 from contextlib import contextmanager
-from typing import Optional
+from typing import Callable, List, Optional
+
+from .instrumentation import InstrumentedConnection, QueryStats
 
 
 class DatabaseConnection:
-    """Singleton managing a single SQLite connection instance."""
-    
+    """Singleton handing out one WAL-mode SQLite connection per thread."""
+
     _instance: Optional['DatabaseConnection'] = None
     _db_path: str = "app.db"
-    
+    _busy_timeout_ms: int = 5000
+    _stats: Optional[QueryStats] = None
+
     def __new__(cls):
-        """Ensure only one connection instance exists."""
+        """Ensure only one connection manager exists."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            instance._local = threading.local()
+            instance._lock = threading.Lock()
+            instance._connections: List[sqlite3.Connection] = []
+            cls._instance = instance
         return cls._instance
-    
-    def __init__(self):
-        """Initialize connection holder."""
-        self._connection: Optional[sqlite3.Connection] = None
-    
+
     @classmethod
     def set_db_path(cls, path: str):
-        """Set database file path."""
+        """Set database file path, closing connections opened on the old one."""
+        if cls._instance is not None:
+            cls._instance.close_all()
         cls._db_path = path
-    
+
+    @classmethod
+    def instrument(cls, stats: Optional[QueryStats] = None) -> Optional[QueryStats]:
+        """Record every statement into stats from now on; None turns recording off."""
+        if cls._instance is not None:
+            cls._instance.close_all()
+        cls._stats = stats
+        return stats
+
+    @classmethod
+    def query_stats(cls) -> Optional[QueryStats]:
+        """Stats being recorded, if instrumentation is on."""
+        return cls._stats
+
     def get_connection(self) -> sqlite3.Connection:
-        """Get or create SQLite connection with row factory."""
-        if self._connection is None:
-            self._connection = sqlite3.connect(self._db_path)
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
-    
+        """Get or create the calling thread's SQLite connection."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is None:
+            conn = self._open_connection()
+            self._local.connection = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a connection with row factory and WAL journaling."""
+        # check_same_thread=False only so close_all() may close connections
+        # from the thread that shuts the app down; each connection is still
+        # used by the single thread that created it.
+        stats = self._stats
+        conn = sqlite3.connect(
+            self._db_path,
+            timeout=self._busy_timeout_ms / 1000,
+            check_same_thread=False,
+            factory=InstrumentedConnection if stats is not None else sqlite3.Connection
+        )
+        if stats is not None:
+            conn.stats = stats
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA busy_timeout = {self._busy_timeout_ms}")
+        return conn
+
     def close(self):
-        """Close database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the calling thread's database connection."""
+        conn = getattr(self._local, 'connection', None)
+        if conn is not None:
+            self._local.connection = None
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+            conn.close()
+
+    def close_all(self):
+        """Close every connection opened by any thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        # Fresh thread-local storage so every thread reconnects on next use
+        self._local = threading.local()
 
 
 @contextmanager
-def get_db():
+def get_db(immediate: bool = False):
     """Context manager handling transactions with automatic commit/rollback."""
     db = DatabaseConnection()
     conn = db.get_connection()
+    # BEGIN IMMEDIATE takes the write lock before the block reads anything
+    if immediate and not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
     try:
         yield conn
     except Exception:
@@ -51,3 +110,15 @@ def get_db():
         raise
     else:
         conn.commit()
+
+
+@contextmanager
+def interruptible(should_abort: Callable[[], bool], every: int = 1000):
+    """Make the calling thread's statements raise OperationalError once should_abort() is true."""
+    conn = DatabaseConnection().get_connection()
+    # SQLite polls the handler every `every` VM instructions
+    conn.set_progress_handler(lambda: 1 if should_abort() else 0, every)
+    try:
+        yield conn
+    finally:
+        conn.set_progress_handler(None, 0)
@@ -1,32 +1,81 @@
 #!/usr/bin/env python3
+import argparse
 import sqlite3
 import os
-from typing import Optional
+import re
+from typing import List, Optional, Tuple
 
 
-def init_database(db_path: str = "app.db", sql_path: Optional[str] = None):
-    """Initialize database with schema."""
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "migrations")
+
+
+def list_migrations(migrations_dir: str = MIGRATIONS_DIR) -> List[Tuple[int, str]]:
+    """Return (version, path) of every NNNN_name.sql migration, in version order."""
+    migrations = []
+    for filename in os.listdir(migrations_dir):
+        match = re.match(r'^(\d+)_\w+\.sql$', filename)
+        if match:
+            migrations.append((int(match.group(1)), os.path.join(migrations_dir, filename)))
+    return sorted(migrations)
+
+
+def migrate(conn: sqlite3.Connection, migrations_dir: str = MIGRATIONS_DIR) -> List[int]:
+    """Apply pending migrations in place, tracking progress in PRAGMA user_version."""
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+    applied = []
+    
+    for version, path in list_migrations(migrations_dir):
+        if version <= current:
+            continue
+        
+        with open(path, 'r') as f:
+            script = f.read()
+        
+        # Each migration and its version bump commit together or not at all
+        try:
+            conn.executescript(f"BEGIN;\n{script}\nPRAGMA user_version = {version};\nCOMMIT;")
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        applied.append(version)
+    
+    return applied
+
+
+def init_database(db_path: str = "app.db", sql_path: Optional[str] = None, reset: bool = False):
+    """Create missing tables and upgrade the schema to the latest migration."""
     if sql_path is None:
         sql_path = os.path.join(os.path.dirname(__file__), "init.sql")
     
-    # Remove existing database for fresh start
-    if os.path.exists(db_path):
-        os.remove(db_path)
+    # Only wipe the database when explicitly asked to
+    if reset and os.path.exists(db_path):
+        for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
         print(f"Removed existing database: {db_path}")
     
-    # Create new database
     conn = sqlite3.connect(db_path)
     
-    # Read and execute schema
+    # Baseline schema uses IF NOT EXISTS, so this is a no-op on existing databases
     with open(sql_path, 'r') as f:
         schema = f.read()
     
     conn.executescript(schema)
     conn.commit()
+    
+    applied = migrate(conn)
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
     conn.close()
     
-    print(f"Database initialized: {db_path}")
+    if applied:
+        print(f"Applied migrations: {', '.join(str(v) for v in applied)}")
+    print(f"Database initialized: {db_path} (schema version {version})")
 
 
 if __name__ == "__main__":
-    init_database()
+    parser = argparse.ArgumentParser(description="Create or upgrade the application database.")
+    parser.add_argument("--db", default="app.db", help="database file path")
+    parser.add_argument("--reset", action="store_true", help="delete the database and start fresh")
+    args = parser.parse_args()
+    init_database(args.db, reset=args.reset)
@@ -0,0 +1,321 @@
+"""Opt-in statement instrumentation: per-query stats, histograms and a slow-query log."""
+import json
+import logging
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from itertools import chain
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds, in milliseconds, of the duration histogram buckets
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, float('inf'))
+
+# Statements EXPLAIN QUERY PLAN can describe
+_EXPLAINABLE = re.compile(r'^\s*(SELECT|WITH|INSERT|UPDATE|DELETE|REPLACE)\b', re.IGNORECASE)
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace, literals and IN lists so equivalent statements group together."""
+    sql = re.sub(r'\s+', ' ', sql).strip()
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+(\.\d+)?\b', '?', sql)
+    # IN (?) and IN (?, ?, ...) lists of any length become IN (...)
+    return re.sub(r'\bIN \(\s*\?(\s*,\s*\?)*\s*\)', 'IN (...)', sql, flags=re.IGNORECASE)
+
+
+def find_caller(depth_limit: int = 25) -> str:
+    """Name the repository method the statement was issued for, e.g. 'OfferRepository.search'."""
+    caller = '<unknown>'
+    frame = sys._getframe(2)
+    for _ in range(depth_limit):
+        if frame is None:
+            break
+        owner = frame.f_locals.get('self')
+        if owner is not None and type(owner).__name__.endswith('Repository'):
+            caller = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        elif caller != '<unknown>':
+            # Outermost of the nested repository calls: the public entry point
+            break
+        frame = frame.f_back
+    return caller
+
+
+class QueryStats:
+    """Thread-safe aggregate of executed statements keyed by normalized SQL."""
+    
+    def __init__(self, slow_ms: float = 50.0, max_slow_queries: int = 200):
+        """Initialize empty stats; statements slower than slow_ms are logged."""
+        self.slow_ms = slow_ms
+        self.queries: Dict[str, Dict[str, Any]] = {}
+        self.slow_queries: Deque[Dict[str, Any]] = deque(maxlen=max_slow_queries)
+        # Statements recorded without a plan yet, explained by their next explicit finish
+        self._unexplained = set()
+        # Reentrant: a cursor collected while this thread records finishes into it too
+        self._lock = threading.RLock()
+    
+    def record(
+        self,
+        conn,
+        sql: str,
+        params: Optional[Sequence],
+        duration: float,
+        rows: int,
+        caller: str,
+        explain: bool = True
+    ):
+        """Add one finished statement; conn is used to explain it the first time.
+        
+        With explain False, e.g. from a garbage-collected cursor, only timing is recorded
+        and the plan is left to the statement's next recording.
+        """
+        key = normalize_sql(sql)
+        duration_ms = duration * 1000
+        with self._lock:
+            entry = self.queries.get(key)
+            if entry is None:
+                entry = self.queries[key] = {
+                    'sql': key,
+                    'count': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'rows': 0,
+                    'params': len(params) if params else 0,
+                    'callers': {},
+                    'histogram': [0] * len(HISTOGRAM_BOUNDS_MS),
+                    'plan': None
+                }
+                self._unexplained.add(key)
+            explain = explain and key in self._unexplained
+            if explain:
+                self._unexplained.discard(key)
+            entry['count'] += 1
+            entry['total_ms'] += duration_ms
+            entry['max_ms'] = max(entry['max_ms'], duration_ms)
+            entry['rows'] += rows
+            entry['callers'][caller] = entry['callers'].get(caller, 0) + 1
+            entry['histogram'][self._bucket(duration_ms)] += 1
+        
+        # Outside the lock: EXPLAIN runs SQL of its own
+        if explain:
+            plan = self.explain(conn, sql, params)
+            with self._lock:
+                entry['plan'] = plan
+        if duration_ms >= self.slow_ms:
+            self._log_slow(key, duration_ms, rows, caller, entry['plan'])
+    
+    @staticmethod
+    def _bucket(duration_ms: float) -> int:
+        """Index of the histogram bucket holding duration_ms."""
+        for index, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if duration_ms <= bound:
+                return index
+        return len(HISTOGRAM_BOUNDS_MS) - 1
+    
+    @staticmethod
+    def explain(conn, sql: str, params: Optional[Sequence]) -> Optional[List[str]]:
+        """Return EXPLAIN QUERY PLAN lines for sql, or None when it cannot be explained."""
+        if not _EXPLAINABLE.match(sql):
+            return None
+        if params is None:
+            # Plans don't depend on values; NULLs satisfy every placeholder
+            params = [None] * sql.count('?')
+        try:
+            # Plain sqlite3 cursor, so explaining is not itself recorded
+            cursor = sqlite3.Cursor(conn)
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return [row[-1] for row in cursor.fetchall()]
+        except Exception as error:
+            return [f"<not explained: {error}>"]
+    
+    def _log_slow(self, sql: str, duration_ms: float, rows: int, caller: str, plan):
+        """Remember and log a statement over the slow threshold with its plan."""
+        self.slow_queries.append({
+            'sql': sql,
+            'duration_ms': round(duration_ms, 3),
+            'rows': rows,
+            'caller': caller,
+            'plan': plan,
+            'at': time.time()
+        })
+        logger.warning(
+            "Slow query %.1f ms (%d rows) in %s: %s\n  plan: %s",
+            duration_ms, rows, caller, sql, '; '.join(plan or ['n/a'])
+        )
+    
+    def full_scans(self) -> List[Dict[str, Any]]:
+        """Statements whose plan scans a whole table without an index."""
+        with self._lock:
+            return [
+                entry for entry in self.queries.values()
+                if any(_is_full_scan(line) for line in entry['plan'] or ())
+            ]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot of all stats, slowest total time first."""
+        with self._lock:
+            queries = sorted(
+                (
+                    {**entry, 'callers': dict(entry['callers']), 'histogram': list(entry['histogram'])}
+                    for entry in self.queries.values()
+                ),
+                key=lambda entry: entry['total_ms'],
+                reverse=True
+            )
+            slow = list(self.slow_queries)
+        for entry in queries:
+            entry['mean_ms'] = entry['total_ms'] / entry['count']
+            entry['full_scan'] = any(_is_full_scan(line) for line in entry['plan'] or ())
+        return {
+            'histogram_bounds_ms': [str(bound) for bound in HISTOGRAM_BOUNDS_MS],
+            'slow_ms': self.slow_ms,
+            'queries': queries,
+            'slow_queries': slow
+        }
+    
+    def dump(self, path: str):
+        """Write the stats snapshot to path as JSON."""
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(self.to_dict(), handle, indent=2)
+    
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.queries.clear()
+            self.slow_queries.clear()
+            self._unexplained.clear()
+
+
+def _is_full_scan(plan_line: str) -> bool:
+    """Tell whether an EXPLAIN QUERY PLAN line reads a whole table."""
+    # Index scans, virtual tables, subqueries and constant rows are not full scans;
+    # sqlite_sequence has one row per AUTOINCREMENT table, so scanning it is free
+    return (
+        plan_line.startswith('SCAN ')
+        and not plan_line.startswith(('SCAN (', 'SCAN sqlite_sequence'))
+        and not any(word in plan_line for word in ('USING', 'VIRTUAL', 'CONSTANT ROW'))
+    )
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor timing each statement from execute until its rows are consumed."""
+    
+    _query: Optional[list] = None
+    
+    def execute(self, sql: str, parameters: Sequence = ()):
+        """Execute sql, recording it once its rows are consumed."""
+        self._finish()
+        caller = find_caller()
+        started = time.perf_counter()
+        super().execute(sql, parameters)
+        self._query = [sql, parameters, time.perf_counter() - started, 0, caller]
+        if self.description is None:
+            # No result set: the statement is already complete
+            self._query[3] = max(self.rowcount, 0)
+            self._finish()
+        return self
+    
+    def executemany(self, sql: str, seq_of_parameters):
+        """Execute sql for every parameter set, recorded as one statement."""
+        self._finish()
+        caller = find_caller()
+        # Keep the first parameter set to explain the statement with
+        parameters = iter(seq_of_parameters)
+        first = next(parameters, None)
+        if first is not None:
+            parameters = chain((first,), parameters)
+        started = time.perf_counter()
+        super().executemany(sql, parameters)
+        self._query = [sql, first, time.perf_counter() - started, max(self.rowcount, 0), caller]
+        self._finish()
+        return self
+    
+    def fetchone(self):
+        """Fetch the next row, timing the step."""
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._consumed(started, 0 if row is None else 1, row is None)
+        return row
+    
+    def fetchmany(self, size: Optional[int] = None):
+        """Fetch up to size rows, timing the steps."""
+        size = self.arraysize if size is None else size
+        started = time.perf_counter()
+        rows = super().fetchmany(size)
+        self._consumed(started, len(rows), len(rows) < size)
+        return rows
+    
+    def fetchall(self):
+        """Fetch the remaining rows, timing the steps."""
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._consumed(started, len(rows), True)
+        return rows
+    
+    def __next__(self):
+        """Fetch the next row while iterating, timing the step."""
+        started = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._consumed(started, 0, True)
+            raise
+        self._consumed(started, 1, False)
+        return row
+    
+    def close(self):
+        """Record a partly consumed statement, then close."""
+        self._finish()
+        super().close()
+    
+    def __del__(self):
+        """Record the timing of statements whose cursor was dropped without being exhausted."""
+        # No EXPLAIN here: finalizers run on whichever thread the collector happens to
+        # run on, possibly while another statement is using the connection
+        self._finish(explain=False)
+    
+    def _consumed(self, started: float, rows: int, exhausted: bool):
+        """Add fetch time and rows to the running statement."""
+        if self._query is not None:
+            self._query[2] += time.perf_counter() - started
+            self._query[3] += rows
+            if exhausted:
+                self._finish()
+    
+    def _finish(self, explain: bool = True):
+        """Hand the running statement, if any, to the connection's stats."""
+        query, self._query = self._query, None
+        if query is not None:
+            sql, parameters, duration, rows, caller = query
+            self.connection.stats.record(self.connection, sql, parameters, duration, rows, caller, explain)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection recording every statement it runs into its stats."""
+    
+    stats: Optional[QueryStats] = None
+    
+    def cursor(self, factory=InstrumentedCursor):
+        """Create an instrumented cursor by default."""
+        return super().cursor(factory)
+    
+    def execute(self, sql: str, parameters: Sequence = ()):
+        """Execute through an instrumented cursor."""
+        return self.cursor().execute(sql, parameters)
+    
+    def executemany(self, sql: str, seq_of_parameters):
+        """Execute many through an instrumented cursor."""
+        return self.cursor().executemany(sql, seq_of_parameters)
+    
+    def executescript(self, script: str):
+        """Run a script, recorded as a single statement."""
+        caller = find_caller()
+        started = time.perf_counter()
+        cursor = super().executescript(script)
+        self.stats.record(self, script, None, time.perf_counter() - started, 0, caller)
+        return cursor
@@ -0,0 +1,30 @@
+-- When a user applied to an offer twice keep the most advanced application:
+-- a decision (accepted/rejected) over pending over applied, then the latest
+DELETE FROM applications
+WHERE id NOT IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY user_id, offer_id
+            ORDER BY
+                CASE status
+                    WHEN 'accepted' THEN 3
+                    WHEN 'rejected' THEN 3
+                    WHEN 'pending' THEN 2
+                    ELSE 1
+                END DESC,
+                id DESC
+        ) AS position
+        FROM applications
+    )
+    WHERE position = 1
+);
+
+-- One application per user and offer; the leading user_id column also
+-- serves get_by_user, so no separate applications(user_id) index is needed
+CREATE UNIQUE INDEX IF NOT EXISTS ux_applications_user_offer ON applications(user_id, offer_id);
+
+CREATE INDEX IF NOT EXISTS idx_applications_offer_id ON applications(offer_id);
+
+CREATE INDEX IF NOT EXISTS idx_offers_company_id ON offers(company_id);
+
+CREATE INDEX IF NOT EXISTS idx_offers_created_at ON offers(created_at);
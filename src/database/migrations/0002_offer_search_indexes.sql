@@ -0,0 +1,2 @@
+-- Salary range filters and salary ordering in OfferRepository.search
+CREATE INDEX IF NOT EXISTS idx_offers_salary ON offers(salary);
@@ -0,0 +1,68 @@
+-- Skill names shared by offers and users, compared case-insensitively
+CREATE TABLE IF NOT EXISTS skills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE COLLATE NOCASE
+);
+
+CREATE TABLE IF NOT EXISTS offer_skills (
+    offer_id INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL,
+    PRIMARY KEY (offer_id, skill_id),
+    FOREIGN KEY (offer_id) REFERENCES offers(id) ON DELETE CASCADE,
+    FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS user_skills (
+    user_id INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL,
+    PRIMARY KEY (user_id, skill_id),
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+-- Inverted index: skill -> offers / users
+CREATE INDEX IF NOT EXISTS idx_offer_skills_skill ON offer_skills(skill_id, offer_id);
+
+CREATE INDEX IF NOT EXISTS idx_user_skills_skill ON user_skills(skill_id, user_id);
+
+-- Repositories relink skills on insert and update; deletes are covered here
+-- so links never outlive their owner, whichever path removed it
+CREATE TRIGGER IF NOT EXISTS offers_delete_skills AFTER DELETE ON offers
+BEGIN
+    DELETE FROM offer_skills WHERE offer_id = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS users_delete_skills AFTER DELETE ON users
+BEGIN
+    DELETE FROM user_skills WHERE user_id = old.id;
+END;
+
+-- Backfill from the comma-joined text columns
+CREATE TEMP TABLE skill_backfill AS
+WITH RECURSIVE split(kind, owner_id, tag, rest) AS (
+    SELECT 'offer', id, '', COALESCE(skill_tags, '') || ',' FROM offers
+    UNION ALL
+    SELECT 'user', id, '', COALESCE(skills_text, '') || ',' FROM users
+    UNION ALL
+    SELECT kind, owner_id,
+           trim(substr(rest, 1, instr(rest, ',') - 1)),
+           substr(rest, instr(rest, ',') + 1)
+    FROM split
+    WHERE rest <> ''
+)
+SELECT kind, owner_id, tag FROM split WHERE tag <> '';
+
+INSERT OR IGNORE INTO skills (name)
+SELECT tag FROM skill_backfill ORDER BY rowid;
+
+INSERT OR IGNORE INTO offer_skills (offer_id, skill_id)
+SELECT b.owner_id, s.id
+FROM skill_backfill b JOIN skills s ON s.name = b.tag
+WHERE b.kind = 'offer';
+
+INSERT OR IGNORE INTO user_skills (user_id, skill_id)
+SELECT b.owner_id, s.id
+FROM skill_backfill b JOIN skills s ON s.name = b.tag
+WHERE b.kind = 'user';
+
+DROP TABLE skill_backfill;
@@ -0,0 +1,56 @@
+-- Keyword index over offer text and the owning company's name and location
+CREATE VIRTUAL TABLE IF NOT EXISTS offers_fts USING fts5(
+    title,
+    description,
+    skill_tags,
+    company_name,
+    company_location,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+
+INSERT INTO offers_fts (rowid, title, description, skill_tags, company_name, company_location)
+SELECT o.id, o.title, o.description, o.skill_tags, c.name, c.location
+FROM offers o LEFT JOIN companies c ON c.id = o.company_id;
+
+-- The rowid of offers_fts is the offer id; triggers keep both in step
+CREATE TRIGGER IF NOT EXISTS offers_fts_insert AFTER INSERT ON offers
+BEGIN
+    INSERT INTO offers_fts (rowid, title, description, skill_tags, company_name, company_location)
+    VALUES (
+        new.id, new.title, new.description, new.skill_tags,
+        (SELECT name FROM companies WHERE id = new.company_id),
+        (SELECT location FROM companies WHERE id = new.company_id)
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS offers_fts_update
+AFTER UPDATE OF title, description, skill_tags, company_id ON offers
+BEGIN
+    DELETE FROM offers_fts WHERE rowid = old.id;
+    INSERT INTO offers_fts (rowid, title, description, skill_tags, company_name, company_location)
+    VALUES (
+        new.id, new.title, new.description, new.skill_tags,
+        (SELECT name FROM companies WHERE id = new.company_id),
+        (SELECT location FROM companies WHERE id = new.company_id)
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS offers_fts_delete AFTER DELETE ON offers
+BEGIN
+    DELETE FROM offers_fts WHERE rowid = old.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS companies_fts_update AFTER UPDATE OF name, location ON companies
+BEGIN
+    UPDATE offers_fts
+    SET company_name = new.name, company_location = new.location
+    WHERE rowid IN (SELECT id FROM offers WHERE company_id = new.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS companies_fts_delete AFTER DELETE ON companies
+BEGIN
+    UPDATE offers_fts
+    SET company_name = NULL, company_location = NULL
+    WHERE rowid IN (SELECT id FROM offers WHERE company_id = old.id);
+END;
@@ -0,0 +1,362 @@
+"""Generate reproducible synthetic datasets of any size for performance testing."""
+import argparse
+import hashlib
+import math
+import random
+import sqlite3
+import time
+from bisect import bisect
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from database import init_db
+
+
+# Role families: title, core skills and median yearly salary
+ROLES = [
+    ('Python Developer', ['Python', 'SQL', 'Django', 'Flask', 'PostgreSQL'], 95000),
+    ('Backend Engineer', ['Go', 'PostgreSQL', 'Docker', 'Kubernetes', 'gRPC'], 110000),
+    ('Java Developer', ['Java', 'Spring', 'SQL', 'Hibernate', 'Maven'], 100000),
+    ('Frontend Developer', ['JavaScript', 'TypeScript', 'React', 'CSS', 'HTML'], 88000),
+    ('Full Stack Developer', ['JavaScript', 'Node.js', 'React', 'SQL', 'Python'], 98000),
+    ('Mobile Developer', ['Kotlin', 'Swift', 'Flutter', 'Android', 'iOS'], 97000),
+    ('Data Scientist', ['Python', 'Machine Learning', 'Pandas', 'SQL', 'Statistics'], 115000),
+    ('Data Engineer', ['Python', 'Spark', 'Airflow', 'SQL', 'Kafka'], 112000),
+    ('DevOps Engineer', ['Linux', 'Docker', 'Kubernetes', 'Terraform', 'AWS'], 108000),
+    ('QA Engineer', ['Selenium', 'Python', 'Testing', 'Cypress', 'CI/CD'], 78000),
+    ('Security Engineer', ['Security', 'Linux', 'Networking', 'Python', 'Cloud'], 120000),
+    ('Embedded Engineer', ['C', 'C++', 'RTOS', 'Embedded', 'Linux'], 99000),
+    ('C# Developer', ['C#', '.NET', 'SQL Server', 'Azure', 'ASP.NET'], 96000),
+    ('ML Engineer', ['Python', 'PyTorch', 'TensorFlow', 'MLOps', 'Kubernetes'], 125000),
+    ('UI/UX Designer', ['Figma', 'UX Research', 'Prototyping', 'CSS', 'Design Systems'], 85000),
+]
+
+# Skills any role may also ask for, most popular first
+COMMON_SKILLS = [
+    'Git', 'SQL', 'Agile', 'English', 'Docker', 'REST', 'Linux', 'AWS', 'Communication',
+    'JavaScript', 'Python', 'CI/CD', 'Scrum', 'Testing', 'GraphQL', 'Redis', 'MongoDB',
+    'Azure', 'GCP', 'Microservices', 'Rust', 'Elasticsearch', 'RabbitMQ', 'Jira', 'Bash'
+]
+
+SENIORITY = [('Junior', 0.7, 25), ('', 1.0, 40), ('Senior', 1.35, 25), ('Lead', 1.6, 7), ('Principal', 1.9, 3)]
+
+# City, relative share of postings and salary factor
+LOCATIONS = [
+    ('San Francisco', 12, 1.35), ('New York', 14, 1.3), ('Seattle', 8, 1.25), ('Austin', 7, 1.05),
+    ('Chicago', 7, 1.0), ('Boston', 6, 1.15), ('Denver', 4, 1.0), ('Atlanta', 4, 0.95),
+    ('London', 9, 1.1), ('Berlin', 7, 0.9), ('Amsterdam', 4, 0.95), ('Paris', 5, 0.9),
+    ('Warsaw', 4, 0.6), ('Toronto', 5, 0.95), ('Remote', 14, 1.0)
+]
+
+COMPANY_PREFIXES = [
+    'Tech', 'Data', 'Cloud', 'Blue', 'Bright', 'Quantum', 'Next', 'Open', 'Smart', 'Green',
+    'Pixel', 'Nova', 'Iron', 'Silver', 'Rapid', 'Deep', 'Alpha', 'Vertex', 'Hyper', 'Core'
+]
+COMPANY_SUFFIXES = [
+    'Corp', 'Labs', 'Systems', 'Works', 'Soft', 'Networks', 'Solutions', 'Dynamics', 'Logic',
+    'Analytics', 'Studio', 'Digital', 'Ventures', 'Group', 'Technologies', 'AI', 'Forge'
+]
+LOGOS = ['assets/tech-corp.jpg', 'assets/startupxyz.jpg', 'assets/enterprise.jpg', '']
+
+FIRST_NAMES = [
+    'Alex', 'Maria', 'John', 'Anna', 'Piotr', 'Emma', 'Liam', 'Olivia', 'Noah', 'Sofia', 'Lucas',
+    'Mia', 'Jakub', 'Zoe', 'Ethan', 'Chloe', 'Omar', 'Leila', 'Kenji', 'Yuki', 'Ravi', 'Priya'
+]
+LAST_NAMES = [
+    'Smith', 'Nowak', 'Garcia', 'Müller', 'Rossi', 'Kowalski', 'Brown', 'Martin', 'Silva', 'Kim',
+    'Tanaka', 'Patel', 'Johnson', 'Lee', 'Novak', 'Dubois', 'Jensen', 'Ivanova', 'Haddad', 'Chen'
+]
+
+# Application status shares: applied, pending, rejected, accepted
+STATUSES = [('applied', 45), ('pending', 30), ('rejected', 20), ('accepted', 5)]
+
+# Offers are spread over the two years before this fixed instant, so runs are reproducible
+NEWEST_OFFER_AT = 1_700_000_000
+OFFER_SPAN_SECONDS = 2 * 365 * 24 * 3600
+
+# Tables whose secondary indexes and FTS trigger are rebuilt once after loading
+LOADED_TABLES = ('users', 'companies', 'offers', 'applications', 'skills', 'offer_skills', 'user_skills')
+
+
+class WeightedChoice:
+    """O(log n) weighted picks from fixed weights using a precomputed cumulative table."""
+    
+    def __init__(self, items: Sequence, weights: Sequence[float]):
+        """Initialize with items and their relative weights."""
+        self.items = list(items)
+        self.cumulative = list(accumulate(weights))
+        self.total = self.cumulative[-1]
+    
+    def pick(self, rng: random.Random):
+        """Return one item drawn by weight."""
+        return self.items[bisect(self.cumulative, rng.random() * self.total)]
+
+
+def zipf_weights(count: int, exponent: float = 1.0) -> List[float]:
+    """Heavy-tailed weights: the item of rank r gets 1 / r**exponent."""
+    return [1 / (rank ** exponent) for rank in range(1, count + 1)]
+
+
+def chunked(rows: Iterator, size: int) -> Iterator[list]:
+    """Group an iterator of rows into lists of at most size rows."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class DataGenerator:
+    """Streams users, companies, offers and applications for a seed into SQLite."""
+    
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        seed: int,
+        offers: int,
+        companies: int,
+        users: int,
+        applications_per_user: float,
+        batch_size: int
+    ):
+        """Initialize generator sizes; every table draws from its own seeded stream."""
+        self.conn = conn
+        self.seed = seed
+        self.offers = offers
+        self.companies = companies
+        self.users = users
+        self.applications_per_user = applications_per_user
+        self.batch_size = batch_size
+        
+        skill_names = list(dict.fromkeys(
+            [skill for _, core, _ in ROLES for skill in core] + COMMON_SKILLS
+        ))
+        self.skill_ids: Dict[str, int] = {name: id for id, name in enumerate(skill_names, start=1)}
+        self.common_skills = WeightedChoice(COMMON_SKILLS, zipf_weights(len(COMMON_SKILLS), 0.8))
+        self.roles = WeightedChoice(ROLES, zipf_weights(len(ROLES), 0.5))
+        self.seniority = WeightedChoice(SENIORITY, [share for _, _, share in SENIORITY])
+        self.locations = WeightedChoice(LOCATIONS, [share for _, share, _ in LOCATIONS])
+        self.statuses = WeightedChoice([status for status, _ in STATUSES], [share for _, share in STATUSES])
+        # A few big employers post most offers
+        self.company_picker = WeightedChoice(range(1, companies + 1), zipf_weights(companies, 1.1))
+        self.company_salary_factor: List[float] = [1.0]
+    
+    def rng(self, table: str) -> random.Random:
+        """Independent stream per table, so resizing one table leaves the others unchanged."""
+        return random.Random(f"{self.seed}:{table}")
+    
+    def insert(self, sql: str, rows: Iterator, label: str, total: Optional[int] = None, links_sql: str = ''):
+        """Write rows with executemany, one transaction per batch, reporting progress.
+        
+        Without a total, e.g. for row counts drawn at random, progress shows rows written only.
+        """
+        # With links_sql rows are (row, skill links) pairs, written together
+        started = time.perf_counter()
+        written = 0
+        for batch in chunked(rows, self.batch_size):
+            with self.conn:
+                if links_sql:
+                    self.conn.executemany(sql, [row for row, _ in batch])
+                    self.conn.executemany(links_sql, [link for _, links in batch for link in links])
+                else:
+                    self.conn.executemany(sql, batch)
+            written += len(batch)
+            elapsed = time.perf_counter() - started
+            progress = f"{written:,}" if total is None else f"{written:,}/{total:,}"
+            print(f"\r  {label}: {progress} rows ({written / max(elapsed, 1e-9):,.0f}/s)", end='', flush=True)
+        print()
+    
+    def generate(self):
+        """Fill every table in dependency order."""
+        self.insert(
+            "INSERT INTO skills (id, name) VALUES (?, ?)",
+            ((id, name) for name, id in self.skill_ids.items()),
+            'skills', len(self.skill_ids)
+        )
+        self.insert(
+            "INSERT INTO companies (id, name, logo_path, location, description) VALUES (?, ?, ?, ?, ?)",
+            self.company_rows(), 'companies', self.companies
+        )
+        self.insert(
+            "INSERT INTO users (id, username, password, full_name, email, profile_path, resume_path, bio, skills_text) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self.user_rows(), 'users', self.users,
+            links_sql="INSERT INTO user_skills (user_id, skill_id) VALUES (?, ?)"
+        )
+        self.insert(
+            "INSERT INTO offers (id, company_id, title, skill_tags, salary, description, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self.offer_rows(), 'offers', self.offers,
+            links_sql="INSERT INTO offer_skills (offer_id, skill_id) VALUES (?, ?)"
+        )
+        self.insert(
+            "INSERT INTO applications (user_id, offer_id, status) VALUES (?, ?, ?)",
+            self.application_rows(), 'applications'
+        )
+    
+    def company_rows(self) -> Iterator[tuple]:
+        """Companies with unique names, a home city and a pay level."""
+        rng = self.rng('companies')
+        name_counts: Dict[str, int] = {}
+        for id in range(1, self.companies + 1):
+            name = f"{rng.choice(COMPANY_PREFIXES)}{rng.choice(COMPANY_SUFFIXES)}"
+            # Number repeated combinations: "Acme Labs", "Acme Labs 2", ...
+            name_counts[name] = name_counts.get(name, 0) + 1
+            if name_counts[name] > 1:
+                name = f"{name} {name_counts[name]}"
+            location, _, factor = self.locations.pick(rng)
+            self.company_salary_factor.append(factor * rng.uniform(0.85, 1.2))
+            yield (
+                id,
+                name,
+                rng.choice(LOGOS),
+                location,
+                f"{name} builds software in {location} with a team of {int(rng.paretovariate(1.2) * 20)} people."
+            )
+    
+    def pick_skills(self, rng: random.Random, core: Sequence[str], count: int) -> List[str]:
+        """Mostly core skills of a role topped up with popular general skills."""
+        skills = rng.sample(core, min(len(core), max(2, count - rng.randint(0, 2))))
+        while len(skills) < count:
+            skill = self.common_skills.pick(rng)
+            if skill not in skills:
+                skills.append(skill)
+        return skills
+    
+    def links(self, owner_id: int, skills: List[str]) -> List[Tuple[int, int]]:
+        """(owner id, skill id) rows linking an owner to its skills."""
+        return [(owner_id, skill_id) for skill_id in sorted({self.skill_ids[skill] for skill in skills})]
+    
+    def user_rows(self) -> Iterator[Tuple[tuple, list]]:
+        """Users named user<N> with password 'password'; user 1 is the demo account."""
+        rng = self.rng('users')
+        password = hashlib.md5('password'.encode()).hexdigest()
+        for id in range(1, self.users + 1):
+            _, core, _ = self.roles.pick(rng)
+            skills = self.pick_skills(rng, core, rng.randint(3, 10))
+            if id == 1:
+                row = (1, 'demo', hashlib.md5('demo'.encode()).hexdigest(), 'Demo User', 'demo@example.com',
+                       'assets/profile.jpg', '', 'Experienced software developer', ', '.join(skills))
+            else:
+                full_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+                row = (id, f"user{id}", password, full_name, f"user{id}@example.com", '', '',
+                       f"{len(skills)} skills, open to new roles", ', '.join(skills))
+            yield row, self.links(id, skills)
+    
+    def offer_rows(self) -> Iterator[Tuple[tuple, list]]:
+        """Offers in id order with creation times growing towards the newest instant."""
+        rng = self.rng('offers')
+        started_at = NEWEST_OFFER_AT - OFFER_SPAN_SECONDS
+        for id in range(1, self.offers + 1):
+            role, core, median = self.roles.pick(rng)
+            skills = self.pick_skills(rng, core, rng.randint(3, 7))
+            level, level_factor, _ = self.seniority.pick(rng)
+            title = f"{level} {role}".strip()
+            company_id = self.company_picker.pick(rng)
+            # Log-normal spread around the role median, scaled by level and employer
+            salary = median * level_factor * self.company_salary_factor[company_id] * math.exp(rng.gauss(0, 0.18))
+            # sqrt skews postings towards recent dates, like a growing job board
+            created_at = started_at + int(OFFER_SPAN_SECONDS * math.sqrt(rng.random()))
+            description = (
+                f"We are hiring a {title} to work with {', '.join(skills[:-1])} and {skills[-1]}. "
+                f"Competitive salary, {rng.choice(['hybrid', 'remote', 'on-site'])} work."
+            )
+            row = (id, company_id, title, ', '.join(skills), round(salary, -3), description, created_at)
+            yield row, self.links(id, skills)
+    
+    def application_rows(self) -> Iterator[tuple]:
+        """Applications per user drawn from a heavy-tailed distribution, one per offer at most."""
+        rng = self.rng('applications')
+        for user_id in range(1, self.users + 1):
+            count = min(self.offers, int(rng.expovariate(1 / self.applications_per_user)))
+            # Favor recent offers: users mostly apply to what is currently listed
+            offer_ids = set()
+            while len(offer_ids) < count:
+                offer_ids.add(self.offers - int(self.offers * rng.random() ** 2))
+            for offer_id in sorted(offer_ids):
+                yield user_id, offer_id, self.statuses.pick(rng)
+
+
+def suspend_indexes(conn: sqlite3.Connection) -> List[str]:
+    """Drop secondary indexes and the offer FTS insert trigger, returning SQL to restore them."""
+    placeholders = ', '.join('?' * len(LOADED_TABLES))
+    rows = conn.execute(
+        "SELECT type, name, sql FROM sqlite_master "
+        f"WHERE tbl_name IN ({placeholders}) AND sql IS NOT NULL "
+        "AND (type = 'index' OR (type = 'trigger' AND name = 'offers_fts_insert'))",
+        LOADED_TABLES
+    ).fetchall()
+    for kind, name, _ in rows:
+        conn.execute(f"DROP {kind.upper()} {name}")
+    return [sql for _, _, sql in rows]
+
+
+def generate_database(
+    db_path: str,
+    seed: int = 42,
+    offers: int = 10_000,
+    companies: int = 0,
+    users: int = 0,
+    applications_per_user: float = 20.0,
+    batch_size: int = 50_000
+):
+    """Create a fresh database at db_path filled with a deterministic dataset."""
+    companies = companies or max(10, offers // 50)
+    users = users or max(10, offers // 100)
+    started = time.perf_counter()
+
+    init_db.init_database(db_path, reset=True)
+    conn = sqlite3.connect(db_path)
+    # Nothing to protect until the load finishes: skip journaling and fsyncs
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -262144")
+
+    with conn:
+        restore = suspend_indexes(conn)
+
+    print(f"Generating seed {seed}: {offers:,} offers, {companies:,} companies, {users:,} users")
+    DataGenerator(conn, seed, offers, companies, users, applications_per_user, batch_size).generate()
+
+    print("  rebuilding indexes and full-text search...")
+    with conn:
+        conn.execute(
+            "INSERT INTO offers_fts (rowid, title, description, skill_tags, company_name, company_location) "
+            "SELECT o.id, o.title, o.description, o.skill_tags, c.name, c.location "
+            "FROM offers o LEFT JOIN companies c ON c.id = o.company_id"
+        )
+        for sql in restore:
+            conn.execute(sql)
+    conn.execute("ANALYZE")
+
+    conn.execute("PRAGMA locking_mode = NORMAL")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.close()
+    print(f"Generated {db_path} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Generate a reproducible synthetic database.")
+    parser.add_argument("--db", default="generated.db", help="database file path (replaced)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed; same seed and sizes give the same data")
+    parser.add_argument("--offers", type=int, default=10_000, help="number of offers, e.g. 1000 to 10000000")
+    parser.add_argument("--companies", type=int, default=0, help="number of companies (default: offers / 50)")
+    parser.add_argument("--users", type=int, default=0, help="number of users (default: offers / 100)")
+    parser.add_argument("--applications-per-user", type=float, default=20.0, help="mean applications per user")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="rows per transaction")
+    args = parser.parse_args()
+
+    generate_database(
+        args.db,
+        seed=args.seed,
+        offers=args.offers,
+        companies=args.companies,
+        users=args.users,
+        applications_per_user=args.applications_per_user,
+        batch_size=args.batch_size
+    )
@@ -1,27 +1,80 @@
 """Main application entry point."""
+# Imported first so the 'imports' mark covers every import below
+from services.startup_timer import startup_timer
+
+import os
+
+from services import LiveSearch, ProfileImagePipeline, get_thumbnail_service, tracer
+
+from kivy.clock import Clock
+from kivy.logger import Logger
+from kivy.uix.screenmanager import SlideTransition
 from kivymd.app import MDApp
-from kivy.uix.screenmanager import ScreenManager, SlideTransition
-from screens import LoginRegisterScreen, MainScreen
+from database import DatabaseConnection, QueryStats, init_db
+from repositories import AsyncRepository
+from screens import LoginRegisterScreen, LazyScreenManager
+
+startup_timer.mark('imports')
+
+# Opt-in statement stats, dumped as JSON on exit: JOB_PORTAL_QUERY_STATS=stats.json
+QUERY_STATS_PATH = os.environ.get('JOB_PORTAL_QUERY_STATS')
+
+# Opt-in span tracing, written as Chrome trace JSON on exit: JOB_PORTAL_TRACE=trace.json
+TRACE_PATH = os.environ.get('JOB_PORTAL_TRACE')
+
+
+def build_main_screen(name):
+    """Import and build the main screen on first navigation after login."""
+    from screens import MainScreen
+    return MainScreen(name=name)
 
 
 class JobPortalApp(MDApp):
     """Main KivyMD application managing screen navigation and theming."""
     
     def build(self):
-        """Initialize screen manager with login and main screens."""
+        """Initialize screen manager showing login, with main screen built on demand."""
         self.theme_cls.theme_style = "Dark"
         self.theme_cls.primary_palette = "Blue"
         
         # Create screen manager
-        sm = ScreenManager(transition=SlideTransition())
+        sm = LazyScreenManager(transition=SlideTransition())
         sm.current_user_id = None  # Store logged in user ID
         
-        # Add screens
+        # Only the login screen is needed before the user signs in
         sm.add_widget(LoginRegisterScreen(name='login'))
-        sm.add_widget(MainScreen(name='main'))
+        sm.register('main', build_main_screen)
         
+        startup_timer.mark('build')
         return sm
+    
+    def on_start(self):
+        """Report cold start timing once the login screen has been drawn."""
+        def first_frame(dt):
+            startup_timer.mark('first frame')
+            Logger.info(startup_timer.report())
+        Clock.schedule_once(first_frame)
+    
+    def on_stop(self):
+        """Stop background thumbnail, search, image and repository workers when the app closes."""
+        get_thumbnail_service().shutdown()
+        LiveSearch.shutdown_all()
+        ProfileImagePipeline.shutdown_all()
+        AsyncRepository.shutdown(wait=False)
+        stats = DatabaseConnection.query_stats()
+        if stats is not None and QUERY_STATS_PATH:
+            stats.dump(QUERY_STATS_PATH)
+        if TRACE_PATH:
+            tracer.stop()
+            tracer.dump(TRACE_PATH)
 
 
 if __name__ == '__main__':
+    if QUERY_STATS_PATH:
+        DatabaseConnection.instrument(QueryStats())
+    if TRACE_PATH:
+        tracer.start()
+    # Upgrade an existing database in place before any screen touches it
+    init_db.init_database()
+    startup_timer.mark('database ready')
     JobPortalApp().run()
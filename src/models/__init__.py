@@ -4,6 +4,7 @@ from .ad import Ad
 from .application import Application, Status
 from .company import Company
 from .offer import Offer
+from .skill import Skill
 from .user import User
 
 __all__ = [
@@ -12,6 +13,7 @@ __all__ = [
     'Company', 
     'Ad',
     'Offer',
+    'Skill',
     'Application',
     'Status'
 ]
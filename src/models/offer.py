@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from typing import List
 
 from .base_model import BaseModel
+from .skill import Skill
 
 
 @dataclass
@@ -17,4 +18,4 @@ class Offer(BaseModel):
 
     def get_skills(self) -> List[str]:
         """Parse skill_tags into list of required skills."""
-        return self.skill_tags.split(', ') if self.skill_tags else []
+        return Skill.parse(self.skill_tags)
@@ -0,0 +1,23 @@
+"""Skill model shared by job offers and user profiles."""
+from dataclasses import dataclass
+from typing import List
+
+from .base_model import BaseModel
+
+
+@dataclass
+class Skill(BaseModel):
+    """Named skill referenced by offers and users through link tables."""
+    name: str
+
+    @staticmethod
+    def parse(text: str) -> List[str]:
+        """Split a comma-joined skill string into unique, trimmed names."""
+        names = []
+        seen = set()
+        for part in (text or '').split(','):
+            name = part.strip()
+            if name and name.lower() not in seen:
+                seen.add(name.lower())
+                names.append(name)
+        return names
@@ -3,6 +3,7 @@ from typing import List
 from dataclasses import dataclass
 
 from .base_model import BaseModel
+from .skill import Skill
 
 
 @dataclass
@@ -19,4 +20,4 @@ class User(BaseModel):
 
     def get_skills(self) -> List[str]:
         """Parse skills_text into list of individual skills."""
-        return self.skills_text.split(', ') if self.skills_text else []
+        return Skill.parse(self.skills_text)
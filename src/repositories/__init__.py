@@ -1,15 +1,32 @@
 from .base_repository import BaseRepository
+from .repository_cache import RepositoryCache
+from .model_mapper import ModelMapper
+from .data_versions import DataVersions
+from .events import ChangeEvent, EntitiesCreated, EntitiesUpdated, EntitiesDeleted, EventBus, event_bus
 from .user_repository import UserRepository
 from .company_repository import CompanyRepository
 from .offer_repository import OfferRepository
 from .application_repository import ApplicationRepository
 from .ad_repository import AdRepository
+from .skill_repository import SkillRepository
+from .async_repository import AsyncRepository
 
 __all__ = [
     'BaseRepository',
+    'RepositoryCache',
+    'ModelMapper',
+    'DataVersions',
+    'ChangeEvent',
+    'EntitiesCreated',
+    'EntitiesUpdated',
+    'EntitiesDeleted',
+    'EventBus',
+    'event_bus',
     'UserRepository',
     'CompanyRepository', 
     'OfferRepository',
     'ApplicationRepository',
-    'AdRepository'
+    'AdRepository',
+    'SkillRepository',
+    'AsyncRepository'
 ]
@@ -1,63 +1,127 @@
 """Repository for job application entity with user and offer filtering."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .base_repository import BaseRepository
-from models import Application, Status
+from .offer_repository import OfferRepository
+from models import Application, Offer, Company
 
 from database import get_db
+from services.tracing import tracer
 
 class ApplicationRepository(BaseRepository[Application]):
     """Manages job applications linking users to offers with status tracking."""
     
+    # Sort keys accepted by get_detailed_by_user, mapped to joined columns
+    DETAIL_ORDER_COLUMNS = {
+        'id': 'a.id',
+        'status': 'a.status',
+        'title': 'o.title',
+        'salary': 'o.salary',
+        'created_at': 'o.created_at',
+        'company': 'c.name'
+    }
+    
     def __init__(self):
         """Initialize repository with Application model and applications table."""
         super().__init__(Application, "applications")
+        self.offer_repo = OfferRepository()
+        self.company_repo = self.offer_repo.company_repo
+        # Joined rows are application, offer summary and company summary columns in turn
+        offer_offset = self._column_count()
+        company_offset = offer_offset + self.offer_repo._column_count(summary=True)
+        self._read_offer = self.offer_repo._joined_reader(offer_offset, summary=True)
+        self._read_company = self.company_repo._joined_reader(company_offset, summary=True)
     
-    def _row_to_model(self, row) -> Application:
-        """Convert database row to Application model instance."""
-        return Application(
-            id=row['id'],
-            user_id=row['user_id'],
-            offer_id=row['offer_id'],
-            status=Status(row['status']) if row['status'] else Status.Applied
-        )
-    
-    def _model_to_dict(self, model: Application) -> dict:
-        """Convert Application model to dictionary for database operations."""
-        return {
-            'id': model.id,
-            'user_id': model.user_id,
-            'offer_id': model.offer_id,
-            'status': model.status.value
-        }
-    
+    @tracer.traced(category='repository')
     def get_by_user(self, user_id: int) -> List[Application]:
         """Retrieve all applications submitted by specific user."""
 
         with get_db() as conn:
             cursor = conn.execute(
-                "SELECT * FROM applications WHERE user_id = ?",
+                f"SELECT {self.select_list} FROM applications WHERE user_id = ?",
                 (user_id,)
             )
-            return [self._row_to_model(row) for row in cursor.fetchall()]
+            return self._map_all(cursor)
     
+    @tracer.traced(category='repository')
     def get_by_offer(self, offer_id: int) -> List[Application]:
         """Retrieve all applications for specific job offer."""
 
         with get_db() as conn:
             cursor = conn.execute(
-                "SELECT * FROM applications WHERE offer_id = ?",
+                f"SELECT {self.select_list} FROM applications WHERE offer_id = ?",
                 (offer_id,)
             )
-            return [self._row_to_model(row) for row in cursor.fetchall()]
+            return self._map_all(cursor)
     
+    @tracer.traced(category='repository')
     def get_by_user_and_offer(self, user_id: int, offer_id: int) -> Optional[Application]:
         """Check if user already applied to specific offer."""
 
         with get_db() as conn:
             cursor = conn.execute(
-                "SELECT * FROM applications WHERE user_id = ? AND offer_id = ?",
+                f"SELECT {self.select_list} FROM applications WHERE user_id = ? AND offer_id = ?",
                 (user_id, offer_id)
             )
             row = cursor.fetchone()
             return self._row_to_model(row) if row else None
+    
+    @tracer.traced(category='repository')
+    def get_detailed_by_user(
+        self,
+        user_id: int,
+        order_by: str = 'id',
+        descending: bool = False,
+        limit: Optional[int] = None
+    ) -> List[Tuple[Application, Offer, Company]]:
+        """Retrieve user's applications with their offer and company in one JOIN."""
+        if order_by not in self.DETAIL_ORDER_COLUMNS:
+            raise ValueError(f"Unsupported order_by: {order_by}")
+        
+        direction = 'DESC' if descending else 'ASC'
+        sql = (
+            f"{self._detailed_select()} "
+            "WHERE a.user_id = ? "
+            f"ORDER BY {self.DETAIL_ORDER_COLUMNS[order_by]} {direction}, a.id {direction}"
+        )
+        params: tuple = (user_id,)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params += (limit,)
+        
+        with get_db() as conn:
+            cursor = conn.execute(sql, params)
+            return self._map_all(cursor, self._row_to_detailed)
+    
+    @tracer.traced(category='repository')
+    def get_detailed_by_ids(self, ids: List[int]) -> List[Tuple[Application, Offer, Company]]:
+        """Retrieve specific applications with their offer and company, in id order."""
+        detailed = []
+        with get_db() as conn:
+            for chunk in self._chunks(ids):
+                cursor = conn.execute(
+                    f"{self._detailed_select()} "
+                    f"WHERE a.id IN ({', '.join('?' * len(chunk))}) ORDER BY a.id",
+                    chunk
+                )
+                detailed.extend(self._map_all(cursor, self._row_to_detailed))
+        return detailed
+    
+    def _detailed_select(self) -> str:
+        """SELECT ... FROM clause joining applications to offer and company summaries."""
+        return (
+            f"SELECT {self._qualified_columns('a')}, "
+            f"{self.offer_repo._qualified_columns('o', summary=True)}, "
+            f"{self.company_repo._qualified_columns('c', summary=True)} "
+            "FROM applications a "
+            "JOIN offers o ON o.id = a.offer_id "
+            "JOIN companies c ON c.id = o.company_id"
+        )
+    
+    def _row_to_detailed(self, row) -> Tuple[Application, Offer, Company]:
+        """Split a joined row into application, offer and company models."""
+        return (
+            self._row_to_model(row),
+            self._read_offer(row),
+            self._read_company(row)
+        )
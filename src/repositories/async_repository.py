@@ -0,0 +1,97 @@
+"""Non-blocking facade running repository calls on a bounded worker pool."""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from .base_repository import BaseRepository
+from services.tracing import tracer
+
+
+T = TypeVar('T')
+
+
+class AsyncRepository(Generic[T]):
+    """Wraps a repository so each method call returns a Future instead of blocking."""
+    
+    # Shared by every facade; SQLite serializes writers anyway, so a few threads suffice
+    max_workers = 4
+    
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
+    def __init__(self, repository: BaseRepository[T]):
+        """Initialize facade over a blocking repository instance."""
+        self.repository = repository
+    
+    def __getattr__(self, name: str) -> Any:
+        """Expose repository methods as functions returning Futures."""
+        attribute = getattr(self.repository, name)
+        if not callable(attribute):
+            return attribute
+        
+        def submit(*args, **kwargs) -> Future:
+            return self.run(attribute, *args, **kwargs)
+        submit.__name__ = name
+        submit.__doc__ = attribute.__doc__
+        return submit
+    
+    @classmethod
+    def run(cls, function: Callable, *args, **kwargs) -> Future:
+        """Run any blocking function, e.g. several repository calls, on the pool."""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=cls.max_workers,
+                    thread_name_prefix='repository'
+                )
+            executor = cls._executor
+        if tracer.enabled:
+            function = cls._traced_job(function)
+        return executor.submit(function, *args, **kwargs)
+    
+    @staticmethod
+    def _traced_job(function: Callable) -> Callable:
+        """Wrap a job in a span that also shows how long it queued for a worker."""
+        submitted = time.perf_counter()
+        name = getattr(function, '__qualname__', repr(function))
+        
+        def job(*args, **kwargs):
+            queued_ms = (time.perf_counter() - submitted) * 1000
+            with tracer.span(f"async {name}", 'executor', queued_ms=f"{queued_ms:.2f}"):
+                return function(*args, **kwargs)
+        return job
+    
+    @staticmethod
+    def wrap(future: Future) -> asyncio.Future:
+        """Adapt a Future for awaiting inside the running asyncio loop."""
+        return asyncio.wrap_future(future)
+    
+    @staticmethod
+    def then(
+        future: Future,
+        on_done: Callable[[Any], None],
+        on_error: Optional[Callable[[BaseException], None]] = None
+    ) -> Future:
+        """Call on_done(result) or on_error(exception) on the Kivy UI thread."""
+        from kivy.clock import Clock
+        
+        def deliver(done: Future):
+            if done.cancelled():
+                return
+            error = done.exception()
+            if error is None:
+                Clock.schedule_once(lambda dt: on_done(done.result()))
+            elif on_error is not None:
+                Clock.schedule_once(lambda dt: on_error(error))
+        future.add_done_callback(deliver)
+        return future
+    
+    @classmethod
+    def shutdown(cls, wait: bool = True):
+        """Stop the shared pool; it is recreated on next use."""
+        with cls._executor_lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
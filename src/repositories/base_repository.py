@@ -1,8 +1,16 @@
 """Abstract base repository providing generic CRUD operations."""
-from abc import ABC, abstractmethod
-from typing import List, Optional, TypeVar, Generic, Type
+import sqlite3
+import threading
+from abc import ABC
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar, Generic, Type
 
+from .data_versions import DataVersions
+from .events import ChangeEvent, EntitiesCreated, EntitiesDeleted, EntitiesUpdated, event_bus
+from .model_mapper import ModelMapper
+from .repository_cache import RepositoryCache
 from database import get_db
+from services.tracing import tracer
 from models import BaseModel
 
 
@@ -12,73 +20,198 @@ T = TypeVar('T', bound=BaseModel)
 class BaseRepository(ABC, Generic[T]):
     """Generic repository abstracting database operations for any model type."""
     
+    # Rows sent to executemany per batch by the *_many bulk operations
+    bulk_chunk_size: int = 1000
+    
+    # Entries in the read-through get_by_id cache; 0 disables caching
+    cache_size: int = 0
+    
+    # Rows pulled per fetchmany call by the streaming iter_* readers
+    fetch_batch_size: int = 500
+    
+    # Long text columns left out of summary reads and loaded by load_details
+    deferred_columns: Tuple[str, ...] = ()
+    
+    # One cache per table, shared by every repository instance using it
+    _caches: Dict[str, RepositoryCache] = {}
+    _caches_lock = threading.Lock()
+    
     def __init__(self, model_class: Type[T], table_name: str):
         """Initialize with model class and database table name."""
         self.model_class = model_class
         self.table_name = table_name
+        self.mapper: ModelMapper[T] = ModelMapper.for_model(model_class)
+        self.columns = self.mapper.columns
+        self.summary_columns = [column for column in self.columns if column not in self.deferred_columns]
+        # Queries select columns in exactly these orders, so rows map by position
+        self.select_list = ', '.join(self.columns)
+        self._row_to_model: Callable[[Sequence], T] = self.mapper.reader(self.columns)
+        self._row_to_summary: Callable[[Sequence], T] = self.mapper.reader(self.summary_columns)
+        self.cache: Optional[RepositoryCache[T]] = None
+        if self.cache_size > 0:
+            with BaseRepository._caches_lock:
+                if table_name not in BaseRepository._caches:
+                    BaseRepository._caches[table_name] = RepositoryCache(self.cache_size)
+                self.cache = BaseRepository._caches[table_name]
     
-    @abstractmethod
-    def _row_to_model(self, row) -> T:
-        """Convert SQLite row to model instance."""
+    def _sync_related(self, conn: sqlite3.Connection, models: List[T]):
+        """Update dependent tables for saved models inside the same transaction."""
         pass
     
-    @abstractmethod
-    def _model_to_dict(self, model: T) -> dict:
-        """Convert model to dictionary for SQL operations."""
-        pass
+    def _qualified_columns(self, alias: str, summary: bool = False) -> str:
+        """Build a select list of alias.column in mapper order for joins."""
+        columns = self.summary_columns if summary else self.columns
+        return ', '.join(f"{alias}.{column}" for column in columns)
     
+    def _joined_reader(self, offset: int, summary: bool = False) -> Callable[[Sequence], T]:
+        """Mapper for this model's columns starting at position offset of a joined row."""
+        return self.mapper.reader(self.summary_columns if summary else self.columns, offset)
+    
+    def _column_count(self, summary: bool = False) -> int:
+        """Number of columns _qualified_columns selects, i.e. the next join offset."""
+        return len(self.summary_columns if summary else self.columns)
+    
+    def _after_write(self, event: ChangeEvent):
+        """Bump the table version, drop cached rows and publish a committed write."""
+        DataVersions.bump(self.table_name)
+        if self.cache is not None:
+            self.cache.invalidate(*event.ids)
+        event_bus.publish(event)
+    
+    @tracer.traced(category='repository')
     def get_by_id(self, id: int) -> Optional[T]:
-        """Retrieve single entity by primary key."""
+        """Retrieve single entity by primary key, served from cache when enabled."""
+        if self.cache is not None:
+            model = self.cache.get(id)
+            if model is not None:
+                return model
+            # A write committing while we read must keep our stale row out of the cache
+            generation = self.cache.generation
+        
         with get_db() as conn:
             cursor = conn.execute(
-                f"SELECT * FROM {self.table_name} WHERE id = ?",
+                f"SELECT {self.select_list} FROM {self.table_name} WHERE id = ?",
                 (id,)
             )
             row = cursor.fetchone()
-            return self._row_to_model(row) if row else None
+            model = self._row_to_model(row) if row else None
+        
+        if model is not None and self.cache is not None:
+            self.cache.put(id, model, generation)
+        return model
     
+    @tracer.traced(category='repository')
     def get_all(self) -> List[T]:
         """Fetch all entities from table."""
         with get_db() as conn:
-            cursor = conn.execute(f"SELECT * FROM {self.table_name}")
-            return [self._row_to_model(row) for row in cursor.fetchall()]
+            cursor = conn.execute(f"SELECT {self.select_list} FROM {self.table_name}")
+            return self._map_all(cursor)
+    
+    def _map_all(self, cursor, mapper: Optional[Callable] = None) -> list:
+        """Fetch the remaining rows of cursor and map each, default to a model."""
+        mapper = mapper or self._row_to_model
+        # Mappers index by position, so plain tuples beat building sqlite3.Row objects
+        cursor.row_factory = None
+        # Separate spans tell SQLite time apart from Python model building
+        with tracer.span('fetch rows', 'sql', table=self.table_name):
+            rows = cursor.fetchall()
+        with tracer.span('build models', 'models', rows=len(rows)):
+            return [mapper(row) for row in rows]
+    
+    def iter_query(
+        self,
+        sql: str,
+        params: Sequence = (),
+        mapper: Optional[Callable] = None,
+        batch_size: Optional[int] = None
+    ) -> Iterator:
+        """Stream mapped rows of a query in fetchmany batches instead of fetchall."""
+        mapper = mapper or self._row_to_model
+        batch_size = batch_size or self.fetch_batch_size
+        
+        with get_db() as conn:
+            cursor = conn.execute(sql, params)
+            cursor.row_factory = None
+            while True:
+                with tracer.span('fetch rows', 'sql', table=self.table_name):
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                with tracer.span('build models', 'models', rows=len(rows)):
+                    models = [mapper(row) for row in rows]
+                yield from models
+    
+    def iter_all(self, batch_size: Optional[int] = None) -> Iterator[T]:
+        """Stream every entity in id order without loading the whole table."""
+        return self.iter_query(
+            f"SELECT {self.select_list} FROM {self.table_name} ORDER BY id",
+            batch_size=batch_size
+        )
+    
+    def iter_summaries(self, batch_size: Optional[int] = None) -> Iterator[T]:
+        """Stream every entity without its deferred long text columns."""
+        return self.iter_query(
+            f"SELECT {', '.join(self.summary_columns)} FROM {self.table_name} ORDER BY id",
+            mapper=self._row_to_summary,
+            batch_size=batch_size
+        )
+    
+    @tracer.traced(category='repository')
+    def load_details(self, model: T) -> T:
+        """Fill in the deferred columns of a model read as a summary."""
+        if not self.deferred_columns:
+            return model
+        
+        with get_db() as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(self.deferred_columns)} FROM {self.table_name} WHERE id = ?",
+                (model.id,)
+            ).fetchone()
+        
+        if row:
+            for column, value in zip(self.deferred_columns, row):
+                setattr(model, column, self.mapper.convert(column, value))
+            self.mapper.mark_loaded(model)
+        return model
     
+    @tracer.traced(category='repository')
     def create(self, model: T) -> T:
         """Insert new entity and populate generated ID."""
-        data = self._model_to_dict(model)
-        # Remove 'id' if it's 0 or None (let SQLite auto-generate)
-        if 'id' in data and (data['id'] == 0 or data['id'] is None):
-            del data['id']
+        columns = self.columns
+        values = self.mapper.to_values(model)
+        # Leave out 'id' if it's 0 or None (let SQLite auto-generate)
+        if not model.id:
+            columns = columns[1:]
+            values = values[1:]
         
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join('?' * len(data))
+        placeholders = ', '.join('?' * len(columns))
         
         with get_db() as conn:
             cursor = conn.execute(
-                f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders})",
-                tuple(data.values())
+                f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES ({placeholders})",
+                values
             )
             # Update model with generated ID
             if cursor.lastrowid is not None:
                 model.id = cursor.lastrowid
+            self._sync_related(conn, [model])
         
+        self._after_write(EntitiesCreated(self.table_name, (model,)))
         return model
     
+    @tracer.traced(category='repository')
     def update(self, model: T) -> T:
-        """Update existing entity by ID."""
-        data = self._model_to_dict(model)
-        id_value = data.pop('id')
-        
-        set_clause = ', '.join(f"{k} = ?" for k in data.keys())
+        """Update existing entity by ID; columns a summary read left out are kept."""
+        unloaded = self.mapper.unloaded(model)
         
         with get_db() as conn:
-            conn.execute(
-                f"UPDATE {self.table_name} SET {set_clause} WHERE id = ?",
-                tuple(data.values()) + (id_value,)
-            )
+            conn.execute(self._update_sql(unloaded), self._update_params(model, unloaded))
+            self._sync_related(conn, [model])
         
+        self._after_write(EntitiesUpdated(self.table_name, (model,)))
         return model
     
+    @tracer.traced(category='repository')
     def delete(self, id: int) -> bool:
         """Remove entity by ID, returning success status."""
         with get_db() as conn:
@@ -86,4 +219,165 @@ class BaseRepository(ABC, Generic[T]):
                 f"DELETE FROM {self.table_name} WHERE id = ?",
                 (id,)
             )
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+        
+        if deleted:
+            self._after_write(EntitiesDeleted(self.table_name, (id,)))
+        return deleted
+    
+    def _update_sql(self, unloaded: Tuple[str, ...] = ()) -> str:
+        """UPDATE by id assigning every column but id and the unloaded ones."""
+        # id is inherited from BaseModel, so it is always the first column
+        columns = [column for column in self.columns[1:] if column not in unloaded]
+        set_clause = ', '.join(f"{column} = ?" for column in columns)
+        return f"UPDATE {self.table_name} SET {set_clause} WHERE id = ?"
+    
+    def _update_params(self, model: T, unloaded: Tuple[str, ...] = ()) -> tuple:
+        """Parameters of _update_sql(unloaded) for model: assigned values, then id."""
+        values = self.mapper.to_values(model)
+        if unloaded:
+            values = tuple(value for column, value in zip(self.columns, values) if column not in unloaded)
+        return values[1:] + values[:1]
+    
+    def _chunks(self, items: Iterable) -> Iterator[list]:
+        """Split any iterable into lists of at most bulk_chunk_size items."""
+        iterator = iter(items)
+        while True:
+            chunk = list(islice(iterator, self.bulk_chunk_size))
+            if not chunk:
+                return
+            yield chunk
+    
+    def _existing_ids(self, conn: sqlite3.Connection, ids: List[int]) -> Set[int]:
+        """Return which of at most bulk_chunk_size ids are stored in the table."""
+        if not ids:
+            return set()
+        cursor = conn.execute(
+            f"SELECT id FROM {self.table_name} WHERE id IN ({', '.join('?' * len(ids))})",
+            ids
+        )
+        return {row[0] for row in cursor.fetchall()}
+    
+    def _next_id(self, conn: sqlite3.Connection) -> int:
+        """Return the next id SQLite would generate for this table."""
+        next_id = conn.execute(
+            f"SELECT COALESCE(MAX(id), 0) + 1 FROM {self.table_name}"
+        ).fetchone()[0]
+        # AUTOINCREMENT never reuses ids of deleted rows
+        try:
+            row = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = ?",
+                (self.table_name,)
+            ).fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row is not None:
+            next_id = max(next_id, row[0] + 1)
+        return next_id
+    
+    def _assign_ids(self, conn: sqlite3.Connection, models: List[T]) -> List[T]:
+        """Give models without an id the next free ids, returning those changed."""
+        assigned = [model for model in models if not model.id]
+        if assigned:
+            next_id = max([self._next_id(conn)] + [model.id + 1 for model in models if model.id])
+            for offset, model in enumerate(assigned):
+                model.id = next_id + offset
+        return assigned
+    
+    def _insert_many(self, models: Iterable[T], on_conflict: str = '') -> List[T]:
+        """Insert models chunk by chunk in one transaction, assigning ids up front."""
+        written: List[T] = []
+        assigned: List[T] = []
+        # Upserted rows that already existed; every other written row is new
+        overwritten: Set[int] = set()
+        
+        try:
+            # Holding the write lock keeps the ids handed out below unused
+            with get_db(immediate=True) as conn:
+                for chunk in self._chunks(models):
+                    if on_conflict and any(self.mapper.unloaded(model) for model in chunk):
+                        # Upserting would overwrite the stored deferred columns with defaults
+                        raise ValueError("Load details of summary models before upserting them")
+                    if on_conflict:
+                        overwritten |= self._existing_ids(conn, [model.id for model in chunk if model.id])
+                    assigned.extend(self._assign_ids(conn, chunk))
+                    placeholders = ', '.join('?' * len(self.columns))
+                    conn.executemany(
+                        f"INSERT INTO {self.table_name} ({self.select_list}) "
+                        f"VALUES ({placeholders}) {on_conflict}",
+                        map(self.mapper.to_values, chunk)
+                    )
+                    self._sync_related(conn, chunk)
+                    written.extend(chunk)
+        except Exception:
+            # Nothing was stored, so don't leave ids pointing at missing rows
+            for model in assigned:
+                model.id = 0
+            raise
+        
+        # Rows carrying ids that existed before the write were updated; the rest are new,
+        # whether their ids were assigned here or given by the caller
+        created = tuple(model for model in written if model.id not in overwritten)
+        upserted = tuple(model for model in written if model.id in overwritten)
+        if created:
+            self._after_write(EntitiesCreated(self.table_name, created))
+        if upserted:
+            self._after_write(EntitiesUpdated(self.table_name, upserted))
+        return written
+    
+    @tracer.traced(category='repository')
+    def create_many(self, models: Iterable[T]) -> List[T]:
+        """Insert many entities in one transaction and populate generated IDs."""
+        return self._insert_many(models)
+    
+    @tracer.traced(category='repository')
+    def upsert_many(self, models: Iterable[T]) -> List[T]:
+        """Insert new entities and overwrite existing ones by ID in one transaction."""
+        columns = [column for column in self.columns if column != 'id']
+        set_clause = ', '.join(f"{column} = excluded.{column}" for column in columns)
+        return self._insert_many(models, f"ON CONFLICT(id) DO UPDATE SET {set_clause}")
+    
+    @tracer.traced(category='repository')
+    def update_many(self, models: Iterable[T]) -> List[T]:
+        """Update many existing entities by ID in one transaction."""
+        updated: List[T] = []
+        
+        with get_db() as conn:
+            for chunk in self._chunks(models):
+                # Summaries skip their unloaded columns, so they need their own statement
+                groups: Dict[Tuple[str, ...], List[T]] = {}
+                for model in chunk:
+                    groups.setdefault(self.mapper.unloaded(model), []).append(model)
+                for unloaded, group in groups.items():
+                    conn.executemany(
+                        self._update_sql(unloaded),
+                        [self._update_params(model, unloaded) for model in group]
+                    )
+                self._sync_related(conn, chunk)
+                updated.extend(chunk)
+        
+        if updated:
+            self._after_write(EntitiesUpdated(self.table_name, tuple(updated)))
+        return updated
+    
+    @tracer.traced(category='repository')
+    def delete_many(self, ids: Iterable[int]) -> int:
+        """Remove many entities by ID in one transaction, returning rows deleted."""
+        removed: List[int] = []
+        
+        # The write lock keeps the ids found below from changing before the delete
+        with get_db(immediate=True) as conn:
+            for chunk in self._chunks(ids):
+                # Only rows that exist are reported, so subscribers see no phantom ids
+                existing = self._existing_ids(conn, chunk)
+                if not existing:
+                    continue
+                conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE id IN ({', '.join('?' * len(existing))})",
+                    list(existing)
+                )
+                removed.extend(id for id in chunk if id in existing)
+        
+        if removed:
+            self._after_write(EntitiesDeleted(self.table_name, tuple(removed)))
+        return len(removed)
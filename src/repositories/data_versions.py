@@ -0,0 +1,27 @@
+"""Per-table write counters used to tell whether cached data is still current."""
+import threading
+from typing import Dict, Tuple
+
+
+class DataVersions:
+    """Process-wide counters bumped by repositories after every committed write."""
+    
+    _versions: Dict[str, int] = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def bump(cls, table: str):
+        """Record that table was written."""
+        with cls._lock:
+            cls._versions[table] = cls._versions.get(table, 0) + 1
+    
+    @classmethod
+    def get(cls, table: str) -> int:
+        """Return how many writes table has seen in this process."""
+        return cls._versions.get(table, 0)
+    
+    @classmethod
+    def snapshot(cls, *tables: str) -> Tuple[int, ...]:
+        """Return the versions of several tables for later comparison."""
+        with cls._lock:
+            return tuple(cls._versions.get(table, 0) for table in tables)
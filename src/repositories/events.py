@@ -0,0 +1,78 @@
+"""In-process event bus carrying typed repository change events."""
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Base event published after a committed write to table."""
+    table: str
+    
+    @property
+    def ids(self) -> Tuple[int, ...]:
+        """Primary keys of the rows affected."""
+        return tuple(model.id for model in getattr(self, 'models', ()))
+
+
+@dataclass(frozen=True)
+class EntitiesCreated(ChangeEvent):
+    """New rows were inserted; models carry their generated ids."""
+    models: Tuple = ()
+
+
+@dataclass(frozen=True)
+class EntitiesUpdated(ChangeEvent):
+    """Existing rows were overwritten with the values in models."""
+    models: Tuple = ()
+
+
+@dataclass(frozen=True)
+class EntitiesDeleted(ChangeEvent):
+    """Rows with deleted_ids were removed."""
+    deleted_ids: Tuple[int, ...] = ()
+    
+    @property
+    def ids(self) -> Tuple[int, ...]:
+        """Primary keys of the rows affected."""
+        return self.deleted_ids
+
+
+Handler = Callable[[ChangeEvent], None]
+
+
+class EventBus:
+    """Thread-safe publish/subscribe dispatcher keyed by table name."""
+    
+    def __init__(self):
+        """Initialize with no subscribers."""
+        self._handlers: Dict[str, List[Tuple[Optional[Type[ChangeEvent]], Handler]]] = {}
+        self._lock = threading.Lock()
+    
+    def subscribe(
+        self,
+        table: str,
+        handler: Handler,
+        event_type: Optional[Type[ChangeEvent]] = None
+    ) -> Callable[[], None]:
+        """Call handler for events on table, optionally of one type; returns unsubscribe."""
+        entry = (event_type, handler)
+        with self._lock:
+            self._handlers.setdefault(table, []).append(entry)
+        
+        def unsubscribe():
+            with self._lock:
+                if entry in self._handlers.get(table, []):
+                    self._handlers[table].remove(entry)
+        return unsubscribe
+    
+    def publish(self, event: ChangeEvent):
+        """Deliver event synchronously, on the publishing thread, to matching handlers."""
+        with self._lock:
+            handlers = list(self._handlers.get(event.table, []))
+        for event_type, handler in handlers:
+            if event_type is None or isinstance(event, event_type):
+                handler(event)
+
+
+event_bus = EventBus()
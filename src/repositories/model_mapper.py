@@ -0,0 +1,137 @@
+"""Column layout of a dataclass model with generated positional row mappers."""
+import threading
+from dataclasses import fields
+from enum import Enum
+from typing import Any, Callable, Dict, Generic, List, Sequence, Tuple, Type, TypeVar, get_type_hints
+
+
+T = TypeVar('T')
+
+# Values stored for NULL columns of these field types
+TYPE_DEFAULTS = {str: '', int: 0, float: 0.0}
+
+# Instance attribute naming the columns a summary read left at their defaults
+UNLOADED_ATTRIBUTE = '_unloaded_columns'
+
+
+class ModelMapper(Generic[T]):
+    """Maps positional row tuples to model instances and models back to tuples.
+    
+    Readers are Python functions generated once per column layout, so building a
+    model is a single positional constructor call with no name lookups per row.
+    """
+    
+    _mappers: Dict[type, 'ModelMapper'] = {}
+    _mappers_lock = threading.Lock()
+    
+    @classmethod
+    def for_model(cls, model_class: Type[T]) -> 'ModelMapper[T]':
+        """Return the shared mapper of a model class, building it on first use."""
+        with cls._mappers_lock:
+            if model_class not in cls._mappers:
+                cls._mappers[model_class] = cls(model_class)
+            return cls._mappers[model_class]
+    
+    def __init__(self, model_class: Type[T]):
+        """Derive columns and per-field conversions from the model's dataclass fields."""
+        self.model_class = model_class
+        self.columns: List[str] = [field.name for field in fields(model_class)]
+        hints = get_type_hints(model_class)
+        self.field_types: Dict[str, type] = {column: hints.get(column, Any) for column in self.columns}
+        self.enum_columns = [
+            column for column, field_type in self.field_types.items()
+            if isinstance(field_type, type) and issubclass(field_type, Enum)
+        ]
+        self._readers: Dict[Tuple[Tuple[str, ...], int], Callable[[Sequence], T]] = {}
+        self._lock = threading.Lock()
+        self.to_values = self._compile_writer()
+    
+    def default(self, column: str) -> Any:
+        """Value a missing or NULL column maps to; enums default to their first member."""
+        field_type = self.field_types[column]
+        if column in self.enum_columns:
+            return next(iter(field_type))
+        return TYPE_DEFAULTS.get(field_type)
+    
+    @staticmethod
+    def unloaded(model: T) -> Tuple[str, ...]:
+        """Columns of model that were not read and only hold defaults."""
+        return getattr(model, UNLOADED_ATTRIBUTE, ())
+    
+    @staticmethod
+    def mark_loaded(model: T):
+        """Record that every column of model now holds stored values."""
+        if UNLOADED_ATTRIBUTE in vars(model):
+            delattr(model, UNLOADED_ATTRIBUTE)
+    
+    def convert(self, column: str, value: Any) -> Any:
+        """Convert one stored value of column to its model attribute value."""
+        if column == 'id':
+            return value
+        if column in self.enum_columns:
+            return self.field_types[column](value) if value else self.default(column)
+        if value is None:
+            return self.default(column)
+        return value
+    
+    def reader(self, columns: Sequence[str], offset: int = 0) -> Callable[[Sequence], T]:
+        """Mapper building a model from row[offset:offset + len(columns)].
+        
+        Model fields missing from columns, e.g. deferred ones, get their defaults
+        and are listed by unloaded() so writes don't store the defaults.
+        """
+        key = (tuple(columns), offset)
+        reader = self._readers.get(key)
+        if reader is None:
+            with self._lock:
+                reader = self._readers.get(key) or self._compile_reader(*key)
+                self._readers[key] = reader
+        return reader
+    
+    def _compile_reader(self, columns: Tuple[str, ...], offset: int) -> Callable[[Sequence], T]:
+        """Generate the source of a positional reader for columns and compile it."""
+        namespace: Dict[str, Any] = {'_model': self.model_class}
+        positions = {column: offset + index for index, column in enumerate(columns)}
+        arguments = []
+        unloaded = tuple(column for column in self.columns if column not in positions)
+        for column in self.columns:
+            if column not in positions:
+                namespace[f'_default_{column}'] = self.default(column)
+                arguments.append(f'_default_{column}')
+                continue
+            
+            value = f'row[{positions[column]}]'
+            if column == 'id':
+                arguments.append(value)
+            elif column in self.enum_columns:
+                namespace[f'_enum_{column}'] = self.field_types[column]
+                namespace[f'_default_{column}'] = self.default(column)
+                arguments.append(f'(_enum_{column}({value}) if {value} else _default_{column})')
+            elif self.field_types[column] in TYPE_DEFAULTS:
+                arguments.append(f'({value} or {TYPE_DEFAULTS[self.field_types[column]]!r})')
+            else:
+                arguments.append(value)
+        
+        if unloaded:
+            namespace['_unloaded'] = unloaded
+            source = (
+                f"def read(row):\n"
+                f"    model = _model({', '.join(arguments)})\n"
+                f"    model.{UNLOADED_ATTRIBUTE} = _unloaded\n"
+                f"    return model\n"
+            )
+        else:
+            source = f"def read(row):\n    return _model({', '.join(arguments)})\n"
+        exec(compile(source, f'<{self.model_class.__name__} reader>', 'exec'), namespace)
+        return namespace['read']
+    
+    def _compile_writer(self) -> Callable[[T], tuple]:
+        """Generate a function returning a model's column values in layout order."""
+        namespace: Dict[str, Any] = {}
+        values = [
+            f'model.{column}.value' if column in self.enum_columns else f'model.{column}'
+            for column in self.columns
+        ]
+        source = f"def to_values(model):\n    return ({', '.join(values)},)\n"
+        exec(compile(source, f'<{self.model_class.__name__} writer>', 'exec'), namespace)
+        return namespace['to_values']
@@ -1,47 +1,212 @@
 """Repository for job offer entity with company filtering."""
-from typing import List
+import re
+import sqlite3
+from typing import Iterable, List, Optional, Tuple
 
 from .base_repository import BaseRepository
-from models import Offer
+from .company_repository import CompanyRepository
+from .skill_repository import SkillRepository
+from models import Offer, Company, Skill
+from database import get_db
+from services.tracing import tracer
 
 
 class OfferRepository(BaseRepository[Offer]):
     """Handles job posting data with filtering by company."""
     
+    # Sort keys accepted by search, mapped to ORDER BY clauses
+    SEARCH_ORDERS = {
+        'newest': 'o.created_at DESC, o.id DESC',
+        'oldest': 'o.created_at ASC, o.id ASC',
+        'salary_desc': 'o.salary DESC, o.id DESC',
+        'salary_asc': 'o.salary ASC, o.id ASC'
+    }
+    
+    # bm25 column weights for offers_fts: title, description, skill_tags,
+    # company_name, company_location
+    FTS_WEIGHTS = (10.0, 1.0, 5.0, 3.0, 2.0)
+    
+    # Descriptions are only shown in the details dialog
+    deferred_columns = ('description',)
+    
     def __init__(self):
         """Initialize repository with Offer model and offers table."""
         super().__init__(Offer, "offers")
+        self.company_repo = CompanyRepository()
+        self.skill_repo = SkillRepository()
+        # Joined rows are offer summary columns followed by company summary columns
+        self._read_company = self.company_repo._joined_reader(self._column_count(summary=True), summary=True)
     
-    def _row_to_model(self, row) -> Offer:
-        """Convert database row to Offer model instance."""
-        return Offer(
-            id=row['id'],
-            company_id=row['company_id'],
-            title=row['title'],
-            skill_tags=row['skill_tags'] or '',
-            salary=row['salary'] or 0.0,
-            description=row['description'] or '',
-            created_at=row['created_at'] or 0
+    def _sync_related(self, conn: sqlite3.Connection, models: List[Offer]):
+        """Relink saved offers to the skills listed in their skill_tags."""
+        self.skill_repo.sync_links(
+            conn, 'offer_skills', 'offer_id',
+            {offer.id: Skill.parse(offer.skill_tags) for offer in models}
         )
     
-    def _model_to_dict(self, model: Offer) -> dict:
-        """Convert Offer model to dictionary for database operations."""
-        return {
-            'id': model.id,
-            'company_id': model.company_id,
-            'title': model.title,
-            'skill_tags': model.skill_tags,
-            'salary': model.salary,
-            'description': model.description,
-            'created_at': model.created_at
-        }
-    
+    @tracer.traced(category='repository')
     def get_by_company(self, company_id: int) -> List[Offer]:
         """Retrieve all job offers posted by specific company."""
-        from database import get_db
         with get_db() as conn:
             cursor = conn.execute(
-                "SELECT * FROM offers WHERE company_id = ?",
+                f"SELECT {self.select_list} FROM offers WHERE company_id = ?",
                 (company_id,)
             )
-            return [self._row_to_model(row) for row in cursor.fetchall()]
+            return self._map_all(cursor)
+    
+    @tracer.traced(category='repository')
+    def get_all_with_company(self) -> List[Tuple[Offer, Company]]:
+        """Fetch every offer paired with its company in a single JOIN query."""
+        with get_db() as conn:
+            cursor = conn.execute(
+                f"{self._offer_with_company_select()} "
+                "ORDER BY o.id"
+            )
+            return self._map_all(cursor, self._row_to_offer_with_company)
+    
+    def _offer_with_company_select(self) -> str:
+        """SELECT ... FROM clause joining offer and company summaries."""
+        return (
+            f"SELECT {self._qualified_columns('o', summary=True)}, "
+            f"{self.company_repo._qualified_columns('c', summary=True)} "
+            "FROM offers o JOIN companies c ON c.id = o.company_id"
+        )
+    
+    def _row_to_offer_with_company(self, row) -> Tuple[Offer, Company]:
+        """Split a joined offer/company summary row into both model instances."""
+        return self._row_to_summary(row), self._read_company(row)
+    
+    @tracer.traced(category='repository')
+    def get_with_company_by_ids(self, ids: List[int]) -> List[Tuple[Offer, Company]]:
+        """Fetch offers with their companies by id, keeping the order of ids."""
+        found = {}
+        with get_db() as conn:
+            for chunk in self._chunks(ids):
+                cursor = conn.execute(
+                    f"{self._offer_with_company_select()} "
+                    f"WHERE o.id IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                )
+                for offer, company in self._map_all(cursor, self._row_to_offer_with_company):
+                    found[offer.id] = (offer, company)
+        return [found[id] for id in ids if id in found]
+    
+    @tracer.traced(category='repository')
+    def search(
+        self,
+        title: Optional[str] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        skills: Optional[Iterable[str]] = None,
+        sort: str = 'newest',
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Tuple[Offer, Company]]:
+        """Filter, sort and page offers in SQL, returning them with their companies."""
+        if sort not in self.SEARCH_ORDERS:
+            raise ValueError(f"Unsupported sort: {sort}")
+        
+        where, params = self._search_conditions(title, min_salary, max_salary, skills)
+        sql = self._offer_with_company_select()
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {self.SEARCH_ORDERS[sort]}"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        
+        with get_db() as conn:
+            cursor = conn.execute(sql, params)
+            return self._map_all(cursor, self._row_to_offer_with_company)
+    
+    @tracer.traced(category='repository')
+    def page(
+        self,
+        after: Optional[Tuple[int, int]] = None,
+        limit: int = 50,
+        title: Optional[str] = None,
+        min_salary: Optional[float] = None,
+        max_salary: Optional[float] = None,
+        skills: Optional[Iterable[str]] = None
+    ) -> List[Tuple[Offer, Company]]:
+        """Fetch the next page of newest offers after a (created_at, id) cursor."""
+        where, params = self._search_conditions(title, min_salary, max_salary, skills)
+        # Seeking through idx_offers_created_at keeps every page as cheap as the
+        # first, unlike OFFSET which rescans all skipped rows
+        if after is not None:
+            where.append("(o.created_at, o.id) < (?, ?)")
+            params += list(after)
+        
+        sql = self._offer_with_company_select()
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {self.SEARCH_ORDERS['newest']} LIMIT ?"
+        params.append(limit)
+        
+        with get_db() as conn:
+            cursor = conn.execute(sql, params)
+            return self._map_all(cursor, self._row_to_offer_with_company)
+    
+    @staticmethod
+    def page_cursor(offer: Offer) -> Tuple[int, int]:
+        """Return the keyset cursor that continues a page ending with offer."""
+        return offer.created_at, offer.id
+    
+    def _search_conditions(
+        self,
+        title: Optional[str],
+        min_salary: Optional[float],
+        max_salary: Optional[float],
+        skills: Optional[Iterable[str]]
+    ) -> Tuple[List[str], list]:
+        """Build WHERE conditions and parameters for the offer search filters."""
+        where: List[str] = []
+        params: list = []
+        
+        if title:
+            where.append("instr(lower(o.title), ?) > 0")
+            params.append(title.lower())
+        if min_salary is not None:
+            where.append("o.salary >= ?")
+            params.append(min_salary)
+        if max_salary is not None:
+            where.append("o.salary <= ?")
+            params.append(max_salary)
+        
+        skill_names = [skill.strip() for skill in skills or [] if skill.strip()]
+        if skill_names:
+            # Offers having any of the skills, through the skill inverted index
+            where.append(
+                "o.id IN (SELECT os.offer_id FROM offer_skills os "
+                "JOIN skills s ON s.id = os.skill_id "
+                f"WHERE s.name IN ({', '.join('?' * len(skill_names))}))"
+            )
+            params.extend(skill_names)
+        
+        return where, params
+    
+    @tracer.traced(category='repository')
+    def full_text_search(self, query: str, limit: int = 50) -> List[Tuple[Offer, Company]]:
+        """Keyword search over offer and company text, best bm25 matches first."""
+        match = self._fts_query(query)
+        if not match:
+            return []
+        
+        weights = ', '.join(str(weight) for weight in self.FTS_WEIGHTS)
+        with get_db() as conn:
+            cursor = conn.execute(
+                f"{self._offer_with_company_select()} "
+                "JOIN offers_fts f ON f.rowid = o.id "
+                "WHERE offers_fts MATCH ? "
+                f"ORDER BY bm25(offers_fts, {weights}) "
+                "LIMIT ?",
+                (match, limit)
+            )
+            return self._map_all(cursor, self._row_to_offer_with_company)
+    
+    @staticmethod
+    def _fts_query(text: str) -> str:
+        """Turn free text into an FTS5 query matching every word as a prefix."""
+        # Quoting each word keeps user input from being parsed as FTS5 syntax
+        words = re.findall(r'\w+', text or '')
+        return ' '.join(f'"{word}"*' for word in words)
@@ -0,0 +1,79 @@
+"""Bounded LRU identity map used by repositories to cache entities by id."""
+import threading
+from collections import OrderedDict
+from typing import Generic, Optional, TypeVar
+
+
+T = TypeVar('T')
+
+
+class RepositoryCache(Generic[T]):
+    """Thread-safe least-recently-used cache of models keyed by primary key."""
+    
+    def __init__(self, max_size: int):
+        """Initialize empty cache holding at most max_size entries."""
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[int, T]' = OrderedDict()
+        self._lock = threading.Lock()
+        # Bumped by every invalidation so fills racing a write can be refused
+        self._generation = 0
+    
+    @property
+    def generation(self) -> int:
+        """Invalidation count; read it before loading a row meant for put."""
+        return self._generation
+    
+    def get(self, id: int) -> Optional[T]:
+        """Return cached model and mark it recently used, counting hit or miss."""
+        with self._lock:
+            model = self._entries.get(id)
+            if model is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(id)
+            self.hits += 1
+            return model
+    
+    def put(self, id: int, model: T, generation: Optional[int] = None) -> bool:
+        """Store model, evicting the least recently used entry when full.
+        
+        With generation, the model is dropped if an invalidation happened since
+        that generation was read, as the row may predate the write.
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._entries[id] = model
+            self._entries.move_to_end(id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return True
+    
+    def invalidate(self, *ids: int):
+        """Drop the given ids from the cache."""
+        with self._lock:
+            self._generation += 1
+            for id in ids:
+                self._entries.pop(id, None)
+    
+    def clear(self):
+        """Drop every entry and reset hit/miss counters."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> dict:
+        """Return size and hit/miss counters for diagnostics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,79 @@
+"""Repository for skill names and their offer/user link tables."""
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from .base_repository import BaseRepository
+from models import Skill
+
+from database import get_db
+
+
+class SkillRepository(BaseRepository[Skill]):
+    """Maintains the skills inverted index shared by offers and users."""
+    
+    def __init__(self):
+        """Initialize repository with Skill model and skills table."""
+        super().__init__(Skill, "skills")
+    
+    def get_by_name(self, name: str) -> Optional[Skill]:
+        """Retrieve skill by case-insensitive name."""
+        with get_db() as conn:
+            cursor = conn.execute(
+                f"SELECT {self.select_list} FROM skills WHERE name = ?",
+                (name.strip(),)
+            )
+            row = cursor.fetchone()
+            return self._row_to_model(row) if row else None
+    
+    def ensure_ids(self, conn: sqlite3.Connection, names: Iterable[str]) -> Dict[str, int]:
+        """Create missing skills and map each lower-cased name to its id."""
+        ids: Dict[str, int] = {}
+        for chunk in self._chunks({name.lower(): name for name in names}.values()):
+            conn.executemany(
+                "INSERT OR IGNORE INTO skills (name) VALUES (?)",
+                [(name,) for name in chunk]
+            )
+            cursor = conn.execute(
+                f"SELECT id, name FROM skills WHERE name IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+            ids.update((row['name'].lower(), row['id']) for row in cursor.fetchall())
+        return ids
+    
+    def sync_links(
+        self,
+        conn: sqlite3.Connection,
+        link_table: str,
+        owner_column: str,
+        owner_skills: Dict[int, List[str]]
+    ):
+        """Replace the skill links of each owner id with the given skill names."""
+        if not owner_skills:
+            return
+        
+        ids = self.ensure_ids(conn, [name for names in owner_skills.values() for name in names])
+        conn.executemany(
+            f"DELETE FROM {link_table} WHERE {owner_column} = ?",
+            [(owner_id,) for owner_id in owner_skills]
+        )
+        conn.executemany(
+            f"INSERT OR IGNORE INTO {link_table} ({owner_column}, skill_id) VALUES (?, ?)",
+            [
+                (owner_id, ids[name.lower()])
+                for owner_id, names in owner_skills.items()
+                for name in names
+            ]
+        )
+    
+    def get_ids_by_names(self, names: Iterable[str]) -> List[int]:
+        """Look up ids of existing skills matching the given names."""
+        names = [name.strip() for name in names if name.strip()]
+        if not names:
+            return []
+        
+        with get_db() as conn:
+            cursor = conn.execute(
+                f"SELECT id FROM skills WHERE name IN ({', '.join('?' * len(names))})",
+                names
+            )
+            return [row['id'] for row in cursor.fetchall()]
@@ -1,8 +1,11 @@
 """Repository for user entity with authentication lookup methods."""
-from typing import Optional
+import sqlite3
+from typing import List, Optional
 
 from .base_repository import BaseRepository
-from models import User
+from .skill_repository import SkillRepository
+from models import User, Skill
+from services.tracing import tracer
 
 
 class UserRepository(BaseRepository[User]):
@@ -11,52 +14,34 @@ class UserRepository(BaseRepository[User]):
     def __init__(self):
         """Initialize repository with User model and users table."""
         super().__init__(User, "users")
+        self.skill_repo = SkillRepository()
     
-    def _row_to_model(self, row) -> User:
-        """Convert database row to User model instance."""
-        return User(
-            id=row['id'],
-            username=row['username'],
-            password=row['password'],
-            full_name=row['full_name'],
-            email=row['email'],
-            profile_path=row['profile_path'] or '',
-            resume_path=row['resume_path'] or '',
-            bio=row['bio'] or '',
-            skills_text=row['skills_text'] or ''
+    def _sync_related(self, conn: sqlite3.Connection, models: List[User]):
+        """Relink saved users to the skills listed in their skills_text."""
+        self.skill_repo.sync_links(
+            conn, 'user_skills', 'user_id',
+            {user.id: Skill.parse(user.skills_text) for user in models}
         )
     
-    def _model_to_dict(self, model: User) -> dict:
-        """Convert User model to dictionary for database operations."""
-        return {
-            'id': model.id,
-            'username': model.username,
-            'password': model.password,
-            'full_name': model.full_name,
-            'email': model.email,
-            'profile_path': model.profile_path,
-            'resume_path': model.resume_path,
-            'bio': model.bio,
-            'skills_text': model.skills_text
-        }
-    
+    @tracer.traced(category='repository')
     def get_by_username(self, username: str) -> Optional[User]:
         """Retrieve user by unique username for login authentication."""
         from database import get_db
         with get_db() as conn:
             cursor = conn.execute(
-                "SELECT * FROM users WHERE username = ?",
+                f"SELECT {self.select_list} FROM users WHERE username = ?",
                 (username,)
             )
             row = cursor.fetchone()
             return self._row_to_model(row) if row else None
     
+    @tracer.traced(category='repository')
     def get_by_email(self, email: str) -> Optional[User]:
         """Retrieve user by email address."""
         from database import get_db
         with get_db() as conn:
             cursor = conn.execute(
-                "SELECT * FROM users WHERE email = ?",
+                f"SELECT {self.select_list} FROM users WHERE email = ?",
                 (email,)
             )
             row = cursor.fetchone()
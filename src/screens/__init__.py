@@ -1,14 +1,31 @@
 """Screen package exposing all UI screens for the application."""
-from .login_register_screen import LoginRegisterScreen
-from .main_screen import MainScreen
-from .offers_screen import OffersScreen
-from .applications_screen import ApplicationsScreen
-from .profile_screen import ProfileScreen
+import importlib
+
+# Screens are imported on first access, so startup only pays for the
+# KivyMD widgets of the screens actually shown
+_SCREEN_MODULES = {
+    'LoginRegisterScreen': '.login_register_screen',
+    'MainScreen': '.main_screen',
+    'OffersScreen': '.offers_screen',
+    'ApplicationsScreen': '.applications_screen',
+    'ProfileScreen': '.profile_screen',
+    'LazyScreenManager': '.lazy_screen_manager'
+}
 
 __all__ = [
     'LoginRegisterScreen',
     'MainScreen',
     'OffersScreen',
     'ApplicationsScreen',
-    'ProfileScreen'
+    'ProfileScreen',
+    'LazyScreenManager'
 ]
+
+
+def __getattr__(name):
+    """Import a screen module the first time one of its classes is requested."""
+    if name in _SCREEN_MODULES:
+        value = getattr(importlib.import_module(_SCREEN_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
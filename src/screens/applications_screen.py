@@ -1,25 +1,28 @@
 """Screen displaying user's job applications with status tracking."""
+from kivy.properties import ObjectProperty
 from kivy.uix.screenmanager import Screen
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivymd.uix.boxlayout import MDBoxLayout
-from kivymd.uix.scrollview import MDScrollView
-from kivymd.uix.list import MDList
 from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
 from kivymd.uix.chip import MDChip
 
-from models import Application, Offer, Company
-from repositories import ApplicationRepository, OfferRepository, CompanyRepository
+from components import CardList
+from services import tracer
+from .change_aware import ChangeAwareMixin
+from repositories import ApplicationRepository, AsyncRepository, EntitiesDeleted
 
 
-class ApplicationCard(MDCard):
-    """Card showing job application with color-coded status indicator."""
+class ApplicationCard(RecycleDataViewBehavior, MDCard):
+    """Recyclable card showing job application with color-coded status indicator."""
     
-    def __init__(self, application: Application, offer: Offer, company: Company, **kwargs):
-        """Initialize with application, offer and company data."""
+    application = ObjectProperty(None, allownone=True)
+    offer = ObjectProperty(None, allownone=True)
+    company = ObjectProperty(None, allownone=True)
+    
+    def __init__(self, **kwargs):
+        """Initialize empty card; data is bound later by the recycle view."""
         super().__init__(**kwargs)
-        self.application = application
-        self.offer = offer
-        self.company = company
         self.orientation = 'vertical'
         self.size_hint_y = None
         self.height = 100
@@ -28,34 +31,40 @@ class ApplicationCard(MDCard):
         self.elevation = 2
         self.build_ui()
     
+    @tracer.traced(category='cards')
     def build_ui(self):
-        """Build card layout with title, company and status color."""
-        title = MDLabel(
-            text=self.offer.title,
+        """Build card layout with title, company and status labels once."""
+        self.title_label = MDLabel(
             font_style='H6',
             size_hint_y=None,
             height=25
         )
-        company = MDLabel(
-            text=f"Company: {self.company.name}",
+        self.company_label = MDLabel(
             theme_text_color='Secondary',
             size_hint_y=None,
             height=20
         )
         
         status_box = MDBoxLayout(size_hint_y=None, height=30)
-        status_label = MDLabel(
-            text=f"Status: {self.application.status.value.upper()}",
+        self.status_label = MDLabel(
             theme_text_color='Custom',
-            text_color=self.get_status_color(),
             bold=True
         )
-        status_box.add_widget(status_label)
+        status_box.add_widget(self.status_label)
         
-        self.add_widget(title)
-        self.add_widget(company)
+        self.add_widget(self.title_label)
+        self.add_widget(self.company_label)
         self.add_widget(status_box)
     
+    @tracer.traced(category='cards')
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this recycled card to the application at index."""
+        super().refresh_view_attrs(rv, index, data)
+        self.title_label.text = self.offer.title
+        self.company_label.text = f"Company: {self.company.name}"
+        self.status_label.text = f"Status: {self.application.status.value.upper()}"
+        self.status_label.text_color = self.get_status_color()
+    
     def get_status_color(self):
         """Return RGBA color tuple based on application status."""
         status = self.application.status
@@ -70,17 +79,18 @@ class ApplicationCard(MDCard):
         return (0.5, 0.5, 0.5, 1)
 
 
-class ApplicationsScreen(Screen):
+class ApplicationsScreen(ChangeAwareMixin, Screen):
     """Screen listing all applications submitted by current user."""
     
+    watched_tables = ('applications', 'offers', 'companies')
+    
     def __init__(self, **kwargs):
         """Initialize repositories and build UI."""
         super().__init__(**kwargs)
-        self.application_repo = ApplicationRepository()
-        self.offer_repo = OfferRepository()
-        self.company_repo = CompanyRepository()
+        self.application_repo = AsyncRepository(ApplicationRepository())
         self.user_id = None
         self.build_ui()
+        self.subscribe_changes('applications', self.on_applications_changed)
     
     def build_ui(self):
         """Create scrollable list layout for application cards."""
@@ -94,26 +104,74 @@ class ApplicationsScreen(Screen):
         header.add_widget(title)
         layout.add_widget(header)
         
-        scroll = MDScrollView()
-        self.applications_list = MDList(spacing=10)
-        scroll.add_widget(self.applications_list)
-        layout.add_widget(scroll)
+        self.applications_list = CardList(ApplicationCard, item_height=100)
+        layout.add_widget(self.applications_list)
         
         self.add_widget(layout)
     
+    @tracer.traced(category='ui')
     def load_applications(self):
-        """Fetch and display applications for current user."""
-        self.applications_list.clear_widgets()
-        applications = self.application_repo.get_by_user(self.user_id)
+        """Fetch applications for current user in the background and display them."""
+        self.mark_loaded()
+        user_id = self.user_id
+        self.load_in_background(
+            self.application_repo.get_detailed_by_user(user_id),
+            lambda applications: self.show_applications(applications, user_id)
+        )
+    
+    @tracer.traced(category='ui')
+    def show_applications(self, applications, user_id):
+        """Bind fetched (application, offer, company) rows to the list."""
+        # Pool results can land after a logout; never show another user's rows
+        if user_id != self.user_id:
+            return
+        self.applications_list.data = [
+            {'application': application, 'offer': offer, 'company': company}
+            for application, offer, company in applications
+        ]
+    
+    def on_applications_changed(self, event):
+        """Patch the cards touched by an application write instead of reloading."""
+        if self._loaded_versions is None:
+            return  # Not shown yet; the first load picks the change up
         
-        for application in applications:
-            offer = self.offer_repo.get_by_id(application.offer_id)
-            if offer:
-                company = self.company_repo.get_by_id(offer.company_id)
-                if company:
-                    card = ApplicationCard(application, offer, company)
-                    self.applications_list.add_widget(card)
-
+        if isinstance(event, EntitiesDeleted):
+            removed = set(event.ids)
+            self.applications_list.data = [
+                item for item in self.applications_list.data
+                if item['application'].id not in removed
+            ]
+            self.acknowledge('applications')
+            return
+        
+        user_id = self.user_id
+        ids = [model.id for model in event.models if model.user_id == user_id]
+        if not ids:
+            self.acknowledge('applications')
+            return
+        self.load_in_background(
+            self.application_repo.get_detailed_by_ids(ids),
+            lambda applications: self.merge_applications(applications, user_id)
+        )
+    
+    @tracer.traced(category='ui')
+    def merge_applications(self, applications, user_id):
+        """Replace cards of changed applications in place and append new ones."""
+        # The list may belong to a different user by the time the rows land
+        if user_id != self.user_id:
+            return
+        changed = {
+            application.id: {'application': application, 'offer': offer, 'company': company}
+            for application, offer, company in applications
+        }
+        data = [
+            changed.pop(item['application'].id, item)
+            for item in self.applications_list.data
+        ]
+        self.applications_list.data = data + list(changed.values())
+        self.acknowledge('applications')
+    
     def on_press(self, *args, **kwargs):
-        """Refresh applications list when tab selected."""
-        self.load_applications()
+        """Refresh applications list when tab selected and its data changed."""
+        if self.data_changed():
+            self.load_applications()
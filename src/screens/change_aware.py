@@ -0,0 +1,48 @@
+"""Mixin letting screens skip reloads when their source tables are unchanged."""
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+from kivy.clock import Clock
+
+from components import Toast
+from repositories import AsyncRepository, ChangeEvent, DataVersions, event_bus
+
+
+class ChangeAwareMixin:
+    """Tracks table versions and user seen at the last load of a screen."""
+    
+    # Tables whose writes make the screen's data stale
+    watched_tables: Tuple[str, ...] = ()
+    
+    _loaded_user = None
+    _loaded_versions: Optional[Dict[str, int]] = None
+    
+    def _current_versions(self) -> Dict[str, int]:
+        """Current versions of the watched tables."""
+        return dict(zip(self.watched_tables, DataVersions.snapshot(*self.watched_tables)))
+    
+    def data_changed(self) -> bool:
+        """Tell whether a reload would show anything new."""
+        return self._loaded_user != self.user_id or self._loaded_versions != self._current_versions()
+    
+    def mark_loaded(self):
+        """Remember the state being loaded; call before querying so racing writes count."""
+        self._loaded_user = self.user_id
+        self._loaded_versions = self._current_versions()
+    
+    def acknowledge(self, table: str):
+        """Record that a change to table was applied in place, so no reload is needed."""
+        if self._loaded_versions is not None:
+            self._loaded_versions[table] = DataVersions.get(table)
+    
+    def subscribe_changes(self, table: str, handler: Callable[[ChangeEvent], None]):
+        """Deliver repository change events for table to handler on the UI thread."""
+        event_bus.subscribe(table, lambda event: Clock.schedule_once(lambda dt: handler(event)))
+    
+    def load_in_background(self, future: Future, apply: Callable):
+        """Call apply(result) on the UI thread once an AsyncRepository future is done."""
+        AsyncRepository.then(future, apply, self.on_load_failed)
+    
+    def on_load_failed(self, error: BaseException):
+        """Report a background query that raised."""
+        Toast.error(f'Could not load data: {error}')
@@ -0,0 +1,23 @@
+"""Screen manager that constructs screens on first navigation."""
+from typing import Callable, Dict
+
+from kivy.uix.screenmanager import Screen, ScreenManager
+
+
+class LazyScreenManager(ScreenManager):
+    """ScreenManager building registered screens the first time they become current."""
+    
+    def __init__(self, **kwargs):
+        """Initialize with no registered screen factories."""
+        super().__init__(**kwargs)
+        self._factories: Dict[str, Callable[[str], Screen]] = {}
+    
+    def register(self, name: str, factory: Callable[[str], Screen]):
+        """Register factory(name) to build the screen when it is first shown."""
+        self._factories[name] = factory
+    
+    def on_current(self, instance, value):
+        """Build the requested screen if needed, then switch to it."""
+        if value is not None and not self.has_screen(value) and value in self._factories:
+            self.add_widget(self._factories.pop(value)(value))
+        super().on_current(instance, value)
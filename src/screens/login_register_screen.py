@@ -14,7 +14,7 @@ from components import Toast
 
 from database import get_db
 from models import User
-from repositories import UserRepository
+from repositories import AsyncRepository, UserRepository
 
 
 class Tab(MDFloatLayout, MDTabsBase):
@@ -28,7 +28,7 @@ class LoginRegisterScreen(Screen):
     def __init__(self, **kwargs):
         """Initialize repository and build tabbed authentication interface."""
         super().__init__(**kwargs)
-        self.user_repo = UserRepository()
+        self.user_repo = AsyncRepository(UserRepository())
         self.build_ui()
     
     def build_ui(self):
@@ -111,8 +111,14 @@ class LoginRegisterScreen(Screen):
         username = self.login_username.text
         password = self.hash_password(self.login_password.text)
         
-        user = self.user_repo.get_by_username(username)
-        
+        AsyncRepository.then(
+            self.user_repo.get_by_username(username),
+            lambda user: self.finish_login(user, password),
+            lambda error: Toast.error(str(error))
+        )
+    
+    def finish_login(self, user, password: str):
+        """Enter the app if the looked-up user matches the password hash."""
         if user and user.password == password:
             self.manager.current_user_id = user.id
             self.manager.current = 'main'
@@ -137,13 +143,21 @@ class LoginRegisterScreen(Screen):
             skills_text=self.reg_skills.text
         )
 
-        try:
-            created_user = self.user_repo.create(user)
-            if created_user.id:
-                Toast.success('Registered successfully!')
-        except Exception as e:
-            Toast.error(str(e))
-            self.clear_register_fields(with_error=True)
+        AsyncRepository.then(
+            self.user_repo.create(user),
+            self.finish_register,
+            self.register_failed
+        )
+    
+    def finish_register(self, created_user):
+        """Confirm a successfully created account."""
+        if created_user.id:
+            Toast.success('Registered successfully!')
+    
+    def register_failed(self, error):
+        """Show why the account could not be created."""
+        Toast.error(str(error))
+        self.clear_register_fields(with_error=True)
     
     def clear_login_fields(self, with_error=False):
         """Reset login form fields and optionally show error state."""
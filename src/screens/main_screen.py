@@ -1,67 +1,81 @@
 """Main application screen with bottom navigation between offers, applications and profile."""
+import importlib
+
 from kivy.uix.screenmanager import Screen
 from kivymd.uix.bottomnavigation import MDBottomNavigation, MDBottomNavigationItem
 from kivymd.uix.boxlayout import MDBoxLayout
 
-from .offers_screen import OffersScreen
-from .applications_screen import ApplicationsScreen
-from .profile_screen import ProfileScreen
-
 
 class MainScreen(Screen):
     """Primary screen containing bottom navigation with three tabs."""
     
+    # Tab name -> (label, icon, module, screen class); tab content is built on first use
+    TABS = {
+        'offers': ('Offers', 'briefcase', '.offers_screen', 'OffersScreen'),
+        'applications': ('Applications', 'file-document', '.applications_screen', 'ApplicationsScreen'),
+        'profile': ('Profile', 'account', '.profile_screen', 'ProfileScreen')
+    }
+    
     def __init__(self, **kwargs):
         """Initialize and build bottom navigation layout."""
         super().__init__(**kwargs)
+        self.tab_items = {}
+        self.tab_screens = {}
         self.build_ui()
     
     def build_ui(self):
-        """Create bottom navigation with offers, applications and profile tabs."""
+        """Create bottom navigation with empty offers, applications and profile tabs."""
         layout = MDBoxLayout(orientation='vertical')
         
         bottom_nav = MDBottomNavigation()
         
-        offers_item = MDBottomNavigationItem(
-            name='offers',
-            text='Offers',
-            icon='briefcase'
-        )
-        self.offers_screen = OffersScreen(name='offers_content')
-        offers_item.bind(on_tab_press=self.offers_screen.on_press)
-        offers_item.add_widget(self.offers_screen)
-        
-        applications_item = MDBottomNavigationItem(
-            name='applications',
-            text='Applications',
-            icon='file-document'
-        )
-        self.applications_screen = ApplicationsScreen(name='applications_content')
-        applications_item.bind(on_tab_press=self.applications_screen.on_press)
-        applications_item.add_widget(self.applications_screen)
-        
-        profile_item = MDBottomNavigationItem(
-            name='profile',
-            text='Profile',
-            icon='account'
-        )
-        self.profile_screen = ProfileScreen(name='profile_content')
-        profile_item.bind(on_tab_press=self.profile_screen.on_press)
-        profile_item.add_widget(self.profile_screen)
-        
-        bottom_nav.add_widget(offers_item)
-        bottom_nav.add_widget(applications_item)
-        bottom_nav.add_widget(profile_item)
+        for name, (text, icon, _, _) in self.TABS.items():
+            item = MDBottomNavigationItem(
+                name=name,
+                text=text,
+                icon=icon
+            )
+            item.bind(on_tab_press=self.on_tab_press)
+            self.tab_items[name] = item
+            bottom_nav.add_widget(item)
         
         layout.add_widget(bottom_nav)
         self.add_widget(layout)
     
+    def get_tab_screen(self, name: str) -> Screen:
+        """Return the content screen of a tab, importing and building it on first use."""
+        screen = self.tab_screens.get(name)
+        if screen is None:
+            _, _, module, class_name = self.TABS[name]
+            screen_class = getattr(importlib.import_module(module, __package__), class_name)
+            screen = screen_class(name=f'{name}_content')
+            self.tab_items[name].add_widget(screen)
+            self.tab_screens[name] = screen
+        screen.user_id = self.manager.current_user_id if self.manager else None
+        return screen
+    
+    @property
+    def offers_screen(self):
+        """Offers tab content, built on first access."""
+        return self.get_tab_screen('offers')
+    
+    @property
+    def applications_screen(self):
+        """Applications tab content, built on first access."""
+        return self.get_tab_screen('applications')
+    
+    @property
+    def profile_screen(self):
+        """Profile tab content, built on first access."""
+        return self.get_tab_screen('profile')
+    
+    def on_tab_press(self, item, *args):
+        """Build the pressed tab if needed and let it refresh its data."""
+        self.get_tab_screen(item.name).on_press()
+    
     def on_enter(self):
-        """Propagate user ID to child screens and load their data."""
-        self.offers_screen.user_id = self.manager.current_user_id
-        self.applications_screen.user_id = self.manager.current_user_id
-        self.profile_screen.user_id = self.manager.current_user_id
-
-        self.offers_screen.load_offers()
-        self.applications_screen.load_applications()
-        self.profile_screen.load_profile()
+        """Propagate user ID to built tabs and refresh those whose data changed."""
+        # Building the visible offers tab here; the others wait for their first press
+        self.get_tab_screen('offers')
+        for name in list(self.tab_screens):
+            self.get_tab_screen(name).on_press()
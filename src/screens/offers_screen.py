@@ -1,30 +1,32 @@
 """Screen for browsing and filtering job offers with application functionality."""
+from kivy.properties import ObjectProperty
 from kivy.uix.screenmanager import Screen
 from kivy.uix.image import Image
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 
 from kivymd.uix.boxlayout import MDBoxLayout
-from kivymd.uix.scrollview import MDScrollView
-from kivymd.uix.list import MDList
 from kivymd.uix.card import MDCard
 from kivymd.uix.label import MDLabel
 from kivymd.uix.button import MDIconButton, MDRaisedButton
 from kivymd.uix.textfield import MDTextField
-from kivymd.uix.dialog import MDDialog
-from kivymd.uix.floatlayout import MDFloatLayout
 
+from components import CardList, Toast
 from models import Offer, Company, Application, Status
-from repositories import OfferRepository, CompanyRepository, ApplicationRepository
+from repositories import AsyncRepository, OfferRepository, ApplicationRepository, UserRepository, EntitiesDeleted
+from services import LiveSearch, SkillMatcher, get_thumbnail_service, tracer
+from .change_aware import ChangeAwareMixin
 
 
-class OfferCard(MDCard):
-    """Clickable card displaying job offer summary with company info."""
+class OfferCard(RecycleDataViewBehavior, MDCard):
+    """Recyclable clickable card displaying job offer summary with company info."""
     
-    def __init__(self, offer: Offer, company: Company, on_click=None, **kwargs):
-        """Initialize card with offer data and optional click handler."""
+    offer = ObjectProperty(None, allownone=True)
+    company = ObjectProperty(None, allownone=True)
+    click_callback = ObjectProperty(None, allownone=True)
+    
+    def __init__(self, **kwargs):
+        """Initialize empty card; data is bound later by the recycle view."""
         super().__init__(**kwargs)
-        self.offer = offer
-        self.company = company
-        self.on_click = on_click
         self.orientation = 'vertical'
         self.size_hint_y = None
         self.height = 120
@@ -33,61 +35,88 @@ class OfferCard(MDCard):
         self.elevation = 2
         self.build_ui()
     
+    @tracer.traced(category='cards')
     def build_ui(self):
-        """Construct card layout with logo, title, company and salary."""
+        """Construct card layout with logo, title, company and salary once."""
         layout = MDBoxLayout(spacing=10)
-        company_logo = Image(source=self.company.logo_path, allow_stretch=True, keep_ratio=True, size_hint_x=0.1)
-        layout.add_widget(company_logo)
+        self.company_logo = Image(allow_stretch=True, keep_ratio=True, size_hint_x=0.1)
+        layout.add_widget(self.company_logo)
 
         details_layout = MDBoxLayout(orientation='vertical')
-        details_layout.add_widget(MDLabel(
-            text=self.offer.title,
+        self.title_label = MDLabel(
             font_style='H6',
             size_hint_y=None,
             height=30
-        ))
+        )
+        details_layout.add_widget(self.title_label)
 
-        details_layout.add_widget(MDLabel(
-            text=f"{self.company.name}",
+        self.company_label = MDLabel(
             theme_text_color='Secondary',
             size_hint_y=None,
             height=20
-        ))
+        )
+        details_layout.add_widget(self.company_label)
 
-        details_layout.add_widget(MDLabel(
-            text=f"{self.company.location} | ${self.offer.salary:,.0f}",
+        self.details_label = MDLabel(
             theme_text_color='Secondary',
             size_hint_y=None,
             height=20
-        ))
+        )
+        details_layout.add_widget(self.details_label)
 
         layout.add_widget(details_layout)
         self.add_widget(layout)
         self.bind(on_release=self.on_card_click)
     
+    @tracer.traced(category='cards')
+    def refresh_view_attrs(self, rv, index, data):
+        """Rebind this recycled card to the offer and company at index."""
+        super().refresh_view_attrs(rv, index, data)
+        # Shared thumbnail textures: a logo is decoded once for all cards
+        get_thumbnail_service().bind_texture(self.company_logo, self.company.logo_path)
+        self.title_label.text = self.offer.title
+        self.company_label.text = f"{self.company.name}"
+        self.details_label.text = f"{self.company.location} | ${self.offer.salary:,.0f}"
+    
     def on_card_click(self, instance):
         """Trigger click callback with offer and company data."""
-        if self.on_click:
-            self.on_click(self.offer, self.company)
+        if self.click_callback:
+            self.click_callback(self.offer, self.company)
 
 
-class OffersScreen(Screen):
+class OffersScreen(ChangeAwareMixin, Screen):
     """Main screen for viewing offers with filtering and application capabilities."""
     
+    watched_tables = ('offers', 'companies')
+    
+    # Offers fetched per page; the next page loads as the list nears its end
+    page_size = 50
+    
     def __init__(self, **kwargs):
         """Initialize repositories and build UI components."""
         super().__init__(**kwargs)
-        self.offer_repo = OfferRepository()
-        self.company_repo = CompanyRepository()
-        self.application_repo = ApplicationRepository()
+        self.offer_repo = AsyncRepository(OfferRepository())
+        self.application_repo = AsyncRepository(ApplicationRepository())
+        self.user_repo = AsyncRepository(UserRepository())
+        self.matcher = SkillMatcher()
         self.offers = []
+        self.filters = {}
+        self.next_cursor = None
+        self.has_more = False
+        self.loading = False
+        self.feed_generation = 0
+        self.showing_matches = False
+        self.search_text = ''
+        self.live_search = LiveSearch(self.offer_repo.repository.full_text_search, self.show_search_results)
         self.dialog = None
         self.filter_dialog = None
         self.user_id = None
         self.build_ui()
+        self.subscribe_changes('offers', self.on_offers_changed)
+        self.subscribe_changes('companies', self.on_companies_changed)
 
     def build_ui(self):
-        """Construct screen layout with header, scrollable list and filter dialog."""
+        """Construct screen layout with header and scrollable list."""
         layout = MDBoxLayout(orientation='vertical')
         
         # Header with filter button
@@ -97,37 +126,173 @@ class OffersScreen(Screen):
             font_style='H5',
             size_hint_x=0.8
         )
+        matches_btn = MDIconButton(
+            icon='star-circle',
+            on_release=self.show_best_matches
+        )
         filter_btn = MDIconButton(
             icon='filter',
             on_release=self.show_filter_dialog
         )
         header.add_widget(title)
+        header.add_widget(matches_btn)
         header.add_widget(filter_btn)
         layout.add_widget(header)
         
-        # Scrollable list
-        scroll = MDScrollView()
-        self.offers_list = MDList(spacing=10)
-        scroll.add_widget(self.offers_list)
-        layout.add_widget(scroll)
+        # Live search: queries run on a worker once typing pauses
+        self.search_field = MDTextField(
+            hint_text='Search offers',
+            size_hint_y=None,
+            height=50
+        )
+        self.search_field.bind(text=self.on_search_text)
+        layout.add_widget(self.search_field)
+        
+        # Recycled list: only cards in view exist, rebound as the user scrolls
+        self.offers_list = CardList(OfferCard, item_height=120)
+        self.offers_list.bind(scroll_y=self.on_scroll)
+        layout.add_widget(self.offers_list)
         
         self.add_widget(layout)
-
-        self.create_filter_dialog()
     
+    @tracer.traced(category='ui')
     def load_offers(self, user_id=None):
-        """Load and display offers."""
-        self.offers_list.clear_widgets()
-        self.offers = self.offer_repo.get_all()
+        """Load and display the first page of offers."""
+        self.mark_loaded()
+        self.reset_feed()
+    
+    def reset_feed(self):
+        """Clear the list and start paging from the newest matching offer."""
+        # Pages still in flight for the previous feed are dropped on arrival
+        self.feed_generation += 1
+        self.offers_list.data = []
+        self.offers = []
+        self.next_cursor = None
+        self.has_more = True
+        self.loading = False
+        self.showing_matches = False
+        self.search_text = ''
+        self.load_next_page()
+    
+    def load_next_page(self):
+        """Fetch the next page after the current keyset cursor in the background."""
+        if not self.has_more or self.loading:
+            return
         
-        for offer in self.offers:
-            company = self.company_repo.get_by_id(offer.company_id)
-            if company:
-                card = OfferCard(offer, company, on_click=self.show_offer_details)
-                self.offers_list.add_widget(card)
+        self.loading = True
+        generation = self.feed_generation
+        self.load_in_background(
+            self.offer_repo.page(after=self.next_cursor, limit=self.page_size, **self.filters),
+            lambda page: self.show_page(page, generation)
+        )
+    
+    @tracer.traced(category='ui')
+    def show_page(self, page, generation):
+        """Append a fetched page unless the feed was reset meanwhile."""
+        if generation != self.feed_generation:
+            return
+        
+        self.loading = False
+        self.has_more = len(page) == self.page_size
+        if page:
+            self.next_cursor = OfferRepository.page_cursor(page[-1][0])
+        
+        self.offers.extend(page)
+        self.offers_list.data.extend(self._card_data(page))
+    
+    def _card_data(self, offers):
+        """Build recycle view data dicts for (offer, company) pairs."""
+        return [
+            {'offer': offer, 'company': company, 'click_callback': self.show_offer_details}
+            for offer, company in offers
+        ]
+    
+    def on_offers_changed(self, event):
+        """Patch loaded cards for offer writes instead of resetting the feed."""
+        # Filtered and ranked lists cannot tell where a changed offer belongs
+        if self._loaded_versions is None or self.filters or self.showing_matches or self.search_text:
+            return
+        
+        if isinstance(event, EntitiesDeleted):
+            removed = set(event.ids)
+            self.offers = [pair for pair in self.offers if pair[0].id not in removed]
+            self.offers_list.data = self._card_data(self.offers)
+            self.acknowledge('offers')
+            return
+        
+        ids = list(event.ids)
+        if len(ids) > self.page_size:
+            self.load_offers()  # Bulk imports are cheaper to page in afresh
+            return
+        generation = self.feed_generation
+        self.load_in_background(
+            self.offer_repo.get_with_company_by_ids(ids),
+            lambda pairs: self.merge_offers(pairs, generation)
+        )
+    
+    @tracer.traced(category='ui')
+    def merge_offers(self, pairs, generation):
+        """Fold changed offers into the loaded part of the newest-first feed."""
+        if generation != self.feed_generation:
+            return
+        
+        changed = {offer.id: (offer, company) for offer, company in pairs}
+        offers = [changed.pop(offer.id, (offer, company)) for offer, company in self.offers]
+        # Offers past the last loaded page arrive with later pages instead
+        offers.extend(
+            pair for pair in changed.values()
+            if not self.has_more
+            or (self.next_cursor is not None and OfferRepository.page_cursor(pair[0]) > self.next_cursor)
+        )
+        offers.sort(key=lambda pair: OfferRepository.page_cursor(pair[0]), reverse=True)
+        
+        self.offers = offers
+        self.offers_list.data = self._card_data(offers)
+        self.acknowledge('offers')
+    
+    def on_companies_changed(self, event):
+        """Swap updated companies into the cards that show them."""
+        if self._loaded_versions is None or isinstance(event, EntitiesDeleted):
+            return  # Cascaded offer deletes are not published; reload on next visit
+        
+        companies = {company.id: company for company in event.models}
+        if any(company.id in companies for _, company in self.offers):
+            self.offers = [
+                (offer, companies.get(company.id, company)) for offer, company in self.offers
+            ]
+            self.offers_list.data = self._card_data(self.offers)
+        self.acknowledge('companies')
+    
+    def on_scroll(self, instance, scroll_y):
+        """Fetch the next page once the list is scrolled near the bottom."""
+        if scroll_y <= 0.1 and self.has_more:
+            self.load_next_page()
+    
+    def on_search_text(self, instance, text):
+        """Debounce typed search text; an emptied box brings the feed back."""
+        if text.strip():
+            self.live_search.submit(text)
+            return
+        
+        self.live_search.cancel()
+        if self.search_text:
+            self.reset_feed()
+    
+    @tracer.traced(category='ui')
+    def show_search_results(self, text, offers):
+        """Replace the list with the best full-text matches for text."""
+        # Pages still in flight for the feed are dropped on arrival
+        self.feed_generation += 1
+        self.has_more = False
+        self.loading = False
+        self.search_text = text
+        self.offers = offers
+        self.offers_list.data = self._card_data(offers)
     
     def create_filter_dialog(self):
         """Create the filter dialog once to preserve state."""
+        from kivymd.uix.dialog import MDDialog
+        
         content = MDBoxLayout(orientation='vertical', spacing=10, size_hint_y=None, height=250)
         
         self.filter_title = MDTextField(hint_text='Title contains')
@@ -152,7 +317,9 @@ class OffersScreen(Screen):
         )
     
     def show_filter_dialog(self, instance):
-        """Show filter dialog."""
+        """Show filter dialog, building it on first use."""
+        if self.filter_dialog is None:
+            self.create_filter_dialog()
         self.filter_dialog.open()
     
     def close_filter_dialog(self, instance):
@@ -167,39 +334,75 @@ class OffersScreen(Screen):
         self.filter_max_salary.text = ''
         self.filter_skills.text = ''
     
+    @tracer.traced(category='ui')
     def apply_filter(self, instance):
         """Apply filters to offers."""
-        title_filter = self.filter_title.text.lower()
-        min_salary = float(self.filter_min_salary.text) if self.filter_min_salary.text else 0
-        max_salary = float(self.filter_max_salary.text) if self.filter_max_salary.text else float('inf')
-        skills_filter = [s.strip().lower() for s in self.filter_skills.text.split(',')] if self.filter_skills.text else []
-        
-        self.offers_list.clear_widgets()
+        title_filter = self.filter_title.text.strip()
+        min_salary = float(self.filter_min_salary.text) if self.filter_min_salary.text else None
+        max_salary = float(self.filter_max_salary.text) if self.filter_max_salary.text else None
+        skills_filter = self.filter_skills.text.split(',') if self.filter_skills.text else []
         
-        for offer in self.offers:
-            # Check title
-            if title_filter and title_filter not in offer.title.lower():
-                continue
-            
-            # Check salary
-            if offer.salary < min_salary or offer.salary > max_salary:
-                continue
-            
-            # Check skills
-            if skills_filter:
-                offer_skills = [s.strip().lower() for s in offer.skill_tags.split(',')]
-                if not any(skill in offer_skills for skill in skills_filter):
-                    continue
-            
-            company = self.company_repo.get_by_id(offer.company_id)
-            if company:
-                card = OfferCard(offer, company, on_click=self.show_offer_details)
-                self.offers_list.add_widget(card)
+        self.search_field.text = ''
+        self.filters = {
+            'title': title_filter,
+            'min_salary': min_salary,
+            'max_salary': max_salary,
+            'skills': skills_filter
+        }
+        self.reset_feed()
         
         self.close_filter_dialog(None)
     
+    def show_best_matches(self, instance):
+        """Show offers ranked by how well they fit the user's skills."""
+        if self.user_id is None:
+            return
+        
+        # Replaces the paged feed; pages still in flight are dropped
+        self.search_field.text = ''
+        self.feed_generation += 1
+        self.has_more = False
+        self.loading = False
+        self.showing_matches = True
+        user_id = self.user_id
+        generation = self.feed_generation
+        
+        def fetch():
+            user = self.user_repo.repository.get_by_id(user_id)
+            if not user:
+                return []
+            ranked = self.matcher.top_matches(user.get_skills(), k=100)
+            return self.offer_repo.repository.get_with_company_by_ids(
+                [offer_id for offer_id, _ in ranked]
+            )
+        
+        self.load_in_background(
+            AsyncRepository.run(fetch),
+            lambda offers: self.show_matches(offers, generation)
+        )
+    
+    @tracer.traced(category='ui')
+    def show_matches(self, offers, generation):
+        """Replace the list with ranked (offer, company) pairs."""
+        # A filter, search or reset since the request owns the list now
+        if generation != self.feed_generation:
+            return
+        self.offers = offers
+        self.offers_list.data = self._card_data(offers)
+    
     def show_offer_details(self, offer: Offer, company: Company):
+        """Load the offer's description in the background, then show the details dialog."""
+        # Cards hold summaries; the description is loaded only when viewed
+        self.load_in_background(
+            self.offer_repo.load_details(offer),
+            lambda offer: self.open_offer_dialog(offer, company)
+        )
+    
+    @tracer.traced(category='ui')
+    def open_offer_dialog(self, offer: Offer, company: Company):
         """Show offer details dialog."""
+        from kivymd.uix.dialog import MDDialog
+        
         content = MDBoxLayout(orientation='vertical', spacing=10, size_hint_y=None, height=200)
         
         content.add_widget(MDLabel(text=f"Title: {offer.title}", font_style='H6'))
@@ -233,21 +436,36 @@ class OffersScreen(Screen):
             self.close_dialog(None)
             return
         
-        # Check if already applied
-        existing = self.application_repo.get_by_user_and_offer(self.user_id, offer.id)
-        if existing:
-            self.close_dialog(None)
-            return
+        applications = self.application_repo.repository
+        user_id = self.user_id
+        
+        def apply():
+            # Check if already applied
+            if applications.get_by_user_and_offer(user_id, offer.id):
+                return None
+            
+            # Create application
+            return applications.create(Application(
+                id=0,
+                user_id=user_id,
+                offer_id=offer.id,
+                status=Status.Applied
+            ))
         
-        # Create application
-        application = Application(
-            id=0,
-            user_id=self.user_id,
-            offer_id=offer.id,
-            status=Status.Applied
+        AsyncRepository.then(
+            AsyncRepository.run(apply),
+            self.on_applied,
+            lambda error: Toast.error(f'Could not apply: {error}')
         )
-        self.application_repo.create(application)
         self.close_dialog(None)
+    
+    def on_applied(self, application):
+        """Tell the user when the offer had already been applied to."""
+        # New applications reach ApplicationsScreen through change events
+        if application is None:
+            Toast.info('You already applied to this offer')
 
     def on_press(self, *args, **kwargs):
-        self.load_offers()
+        """Reload offers when tab selected and offers or companies changed."""
+        if self.data_changed():
+            self.load_offers()
@@ -1,9 +1,5 @@
 """Screen for managing user profile, resume and profile picture."""
 from kivy.uix.screenmanager import Screen
-from kivy.uix.popup import Popup
-from kivy.uix.filechooser import FileChooserListView
-from kivy.uix.button import Button
-from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.image import Image
 from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.scrollview import MDScrollView
@@ -12,8 +8,11 @@ from kivymd.uix.textfield import MDTextField
 from kivymd.uix.button import MDRaisedButton, MDIconButton
 from kivymd.uix.card import MDCard
 
+from components import Toast
 from models import User
-from repositories import UserRepository
+from repositories import AsyncRepository, UserRepository, EntitiesUpdated
+from services import ProfileImagePipeline, tracer
+from .change_aware import ChangeAwareMixin
 
 
 class ProfileImage(MDCard):
@@ -35,17 +34,21 @@ class ProfileImage(MDCard):
         self.image.source = source
 
 
-class ProfileScreen(Screen):
+class ProfileScreen(ChangeAwareMixin, Screen):
     """Profile management screen with file upload and edit capabilities."""
     
+    watched_tables = ('users',)
+    
     def __init__(self, **kwargs):
         """Initialize repository and build editable profile form."""
         super().__init__(**kwargs)
-        self.user_repo = UserRepository()
+        self.user_repo = AsyncRepository(UserRepository())
+        self.image_pipeline = ProfileImagePipeline()
         self.current_user = None
         self.file_popup = None
         self.user_id = None
         self.build_ui()
+        self.subscribe_changes('users', self.on_users_changed)
     
     def build_ui(self):
         """Construct scrollable form with image, fields and file uploaders."""
@@ -92,10 +95,23 @@ class ProfileScreen(Screen):
         scroll.add_widget(layout)
         self.add_widget(scroll)
     
+    @tracer.traced(category='ui')
     def load_profile(self):
-        """Populate form fields from current user database record."""
-
-        self.current_user = self.user_repo.get_by_id(self.user_id)
+        """Fetch current user record in the background and populate form fields."""
+        self.mark_loaded()
+        user_id = self.user_id
+        self.load_in_background(
+            self.user_repo.get_by_id(user_id),
+            lambda user: self.show_profile(user, user_id)
+        )
+    
+    @tracer.traced(category='ui')
+    def show_profile(self, user, user_id):
+        """Populate form fields from a fetched user record."""
+        # Pool results can land after a logout; never show another user's record
+        if user_id != self.user_id:
+            return
+        self.current_user = user
         
         if self.current_user:
             self.fullname_field.text = self.current_user.full_name
@@ -105,6 +121,17 @@ class ProfileScreen(Screen):
             self.profile_image.source = self.current_user.profile_path
             self.resume_label.text = self.current_user.resume_path.split('/')[-1]
     
+    def on_users_changed(self, event):
+        """Keep the form in sync with user writes without refetching the record."""
+        if self._loaded_versions is None or not isinstance(event, EntitiesUpdated):
+            return
+        
+        for user in event.models:
+            # Our own save already shows in the form; only foreign edits are shown
+            if user.id == self.user_id and user is not self.current_user:
+                self.show_profile(user, user.id)
+        self.acknowledge('users')
+    
     def choose_profile_image(self, instance):
         """Open file browser filtering for image files only."""
         self.show_file_chooser(['*.png', '*.jpg', '*.jpeg'], self.set_profile_image)
@@ -115,6 +142,12 @@ class ProfileScreen(Screen):
     
     def show_file_chooser(self, filters, callback):
         """Display popup with file browser and select/cancel buttons."""
+        # The file browser is only needed when the user uploads something
+        from kivy.uix.popup import Popup
+        from kivy.uix.filechooser import FileChooserListView
+        from kivy.uix.button import Button
+        from kivy.uix.boxlayout import BoxLayout
+        
         content = BoxLayout(orientation='vertical')
         
         filechooser = FileChooserListView(
@@ -146,10 +179,28 @@ class ProfileScreen(Screen):
             self.file_popup.dismiss()
     
     def set_profile_image(self, path):
-        """Update profile image widget and store path in user model."""
-        self.profile_image.set_source(path)
+        """Resize and re-encode the picked image in the background before using it."""
         if self.current_user:
-            self.current_user.profile_path = path
+            user_id = self.current_user.id
+            self.image_pipeline.ingest(
+                path,
+                user_id,
+                lambda variants: self.on_profile_image_ready(variants, user_id),
+                self.on_profile_image_failed
+            )
+    
+    def on_profile_image_ready(self, variants, user_id):
+        """Show the processed variant and store its path in user model."""
+        # Processing can outlast a logout; never put the picture on another user
+        if user_id != self.user_id or not self.current_user or self.current_user.id != user_id:
+            return
+        path = variants[self.image_pipeline.display_size]
+        self.profile_image.source = path
+        self.current_user.profile_path = path
+    
+    def on_profile_image_failed(self, error):
+        """Report an image that could not be decoded or written."""
+        Toast.error(f'Could not use this image: {error}')
     
     def set_resume(self, path):
         """Update resume label and store path in user model."""
@@ -159,10 +210,20 @@ class ProfileScreen(Screen):
     
     def save_profile(self, instance):
         """Persist profile changes to database."""
-        if self.current_user:
+        if self.current_user and self.current_user.id == self.user_id:
             self.current_user.bio = self.bio_field.text
             self.current_user.skills_text = self.skills_field.text
-            self.user_repo.update(self.current_user)
+            AsyncRepository.then(
+                self.user_repo.update(self.current_user),
+                self.on_profile_saved,
+                lambda error: Toast.error(f'Could not save profile: {error}')
+            )
+    
+    def on_profile_saved(self, user):
+        """Confirm the save and drop picture variants the stored profile no longer uses."""
+        # Only now is the old picture unreferenced; an unsaved pick must not delete it
+        self.image_pipeline.prune(user.id, user.profile_path)
+        Toast.success('Profile saved')
     
     def logout(self, instance):
         """Clear user session and navigate to login screen."""
@@ -172,5 +233,6 @@ class ProfileScreen(Screen):
             manager.current = 'login'
 
     def on_press(self, *args, **kwargs):
-        """Refresh profile data when tab becomes active."""
-        self.load_profile()
\ No newline at end of file
+        """Refresh profile data when tab becomes active and the user record changed."""
+        if self.data_changed():
+            self.load_profile()
\ No newline at end of file
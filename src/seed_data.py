@@ -34,10 +34,8 @@ def seed_database():
         Company(id=0, name='Enterprise Inc', logo_path='assets/enterprise.jpg', location='Chicago', description='Fortune 500 company')
     ]
     
-    created_companies = []
-    for company in companies:
-        created = company_repo.create(company)
-        created_companies.append(created)
+    created_companies = company_repo.create_many(companies)
+    for created in created_companies:
         print(f"Created company: {created.name}")
     
     # Create sample offers
@@ -56,10 +54,8 @@ def seed_database():
               description='ML and data analysis role', created_at=1234567893)
     ]
     
-    created_offers = []
-    for offer in offers:
-        created = offer_repo.create(offer)
-        created_offers.append(created)
+    created_offers = offer_repo.create_many(offers)
+    for created in created_offers:
         print(f"Created offer: {created.title}")
     
     # Create sample application
@@ -78,5 +74,5 @@ def seed_database():
 
 if __name__ == '__main__':
     # Initialize fresh database
-    init_db.init_database()
+    init_db.init_database(reset=True)
     seed_database()
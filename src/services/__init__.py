@@ -0,0 +1,37 @@
+"""Services package for application logic built on top of the repositories."""
+import importlib
+
+# Services are imported on first access, so startup doesn't pay for the
+# matcher, image pipelines or search worker before a screen needs them
+_SERVICE_MODULES = {
+    'SkillMatcher': '.skill_matcher',
+    'ThumbnailService': '.thumbnails',
+    'get_thumbnail_service': '.thumbnails',
+    'ProfileImagePipeline': '.profile_images',
+    'StartupTimer': '.startup_timer',
+    'startup_timer': '.startup_timer',
+    'LiveSearch': '.live_search',
+    'Tracer': '.tracing',
+    'tracer': '.tracing'
+}
+
+__all__ = [
+    'SkillMatcher',
+    'ThumbnailService',
+    'get_thumbnail_service',
+    'ProfileImagePipeline',
+    'StartupTimer',
+    'startup_timer',
+    'LiveSearch',
+    'Tracer',
+    'tracer'
+]
+
+
+def __getattr__(name):
+    """Import a service module the first time one of its names is requested."""
+    if name in _SERVICE_MODULES:
+        value = getattr(importlib.import_module(_SERVICE_MODULES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
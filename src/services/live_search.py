@@ -0,0 +1,98 @@
+"""Search-as-you-type: debounced queries run on a worker, stale ones interrupted."""
+import sqlite3
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from database import interruptible
+
+
+class LiveSearch:
+    """Runs only the latest of rapidly typed queries off the UI thread."""
+    
+    # Live instances, so the app can stop every worker on exit
+    _instances: 'weakref.WeakSet[LiveSearch]' = weakref.WeakSet()
+    
+    def __init__(
+        self,
+        search: Callable[[str], List],
+        on_results: Callable[[str, List], None],
+        delay: float = 0.25
+    ):
+        """Initialize with a blocking search function and a UI-thread results callback."""
+        self.search = search
+        self.on_results = on_results
+        self.delay = delay
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._trigger = None
+        # One worker: a new query waits at most for the interrupted old one
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='live-search')
+        LiveSearch._instances.add(self)
+    
+    def submit(self, text: str):
+        """Schedule a search for text once typing pauses for delay seconds."""
+        from kivy.clock import Clock
+        
+        generation = self._invalidate()
+        self._trigger = Clock.schedule_once(lambda dt: self._start(text, generation), self.delay)
+    
+    def cancel(self):
+        """Drop the pending search and interrupt the one running, if any."""
+        self._invalidate()
+    
+    def _invalidate(self) -> int:
+        """Mark every earlier query stale and return the new generation."""
+        if self._trigger is not None:
+            self._trigger.cancel()
+            self._trigger = None
+        with self._lock:
+            self._generation += 1
+            return self._generation
+    
+    def _is_stale(self, generation: int) -> bool:
+        """Tell whether a newer query superseded generation."""
+        with self._lock:
+            return generation != self._generation
+    
+    def _start(self, text: str, generation: int):
+        """Hand the debounced query to the worker."""
+        self._trigger = None
+        self._executor.submit(self._run, text, generation)
+    
+    def _run(self, text: str, generation: int):
+        """Run the query on the worker, aborting it as soon as it goes stale."""
+        from kivy.clock import Clock
+        from kivy.logger import Logger
+        
+        if self._is_stale(generation):
+            return
+        try:
+            with interruptible(lambda: self._is_stale(generation)):
+                results = self.search(text)
+        except Exception as error:
+            # An interrupted query raises OperationalError; that is expected
+            if isinstance(error, sqlite3.OperationalError) and self._is_stale(generation):
+                return
+            # Nothing waits on the worker's future, so report the failure here
+            Logger.exception(f"LiveSearch: search for {text!r} failed")
+            return
+        Clock.schedule_once(lambda dt: self._deliver(text, results, generation))
+    
+    def _deliver(self, text: str, results: List, generation: int):
+        """Pass results to the UI unless a newer query was typed meanwhile."""
+        if not self._is_stale(generation):
+            self.on_results(text, results)
+    
+    def shutdown(self):
+        """Cancel outstanding work and stop the worker thread."""
+        self.cancel()
+        self._executor.shutdown(wait=False)
+        LiveSearch._instances.discard(self)
+    
+    @classmethod
+    def shutdown_all(cls):
+        """Shut down every live instance's worker, e.g. when the app stops."""
+        for live_search in list(cls._instances):
+            live_search.shutdown()
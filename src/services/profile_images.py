@@ -0,0 +1,106 @@
+"""Background ingest of user-picked profile pictures into small square variants."""
+import glob
+import hashlib
+import os
+import weakref
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Sequence
+
+
+def process_profile_image(source: str, output_dir: str, user_id: int, sizes: Sequence[int]) -> Dict[int, str]:
+    """Crop source to a square and write one metadata-free JPEG per size."""
+    from PIL import Image, ImageOps
+    
+    os.makedirs(output_dir, exist_ok=True)
+    with open(source, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    
+    variants = {}
+    with Image.open(source) as image:
+        # Let the JPEG decoder downscale while decoding instead of at full size
+        image.draft('RGB', (max(sizes) * 2, max(sizes) * 2))
+        # Apply EXIF orientation before the metadata is dropped
+        image = ImageOps.exif_transpose(image).convert('RGB')
+        for size in sizes:
+            variant = ImageOps.fit(image, (size, size), Image.LANCZOS)
+            path = os.path.join(output_dir, f"user_{user_id}_{digest}_{size}.jpg")
+            partial = f"{path}.tmp"
+            # Saving without exif/icc_profile strips camera metadata
+            variant.save(partial, format='JPEG', quality=85, optimize=True, progressive=True)
+            os.replace(partial, path)
+            variants[size] = path
+    
+    return variants
+
+
+def remove_stale_variants(output_dir: str, user_id: int, keep_path: str) -> int:
+    """Delete the user's variants except those of the picture keep_path belongs to."""
+    # Variants are named user_<id>_<digest>_<size>.jpg; siblings share the prefix
+    keep_prefix = os.path.basename(keep_path).rpartition('_')[0] + '_' if keep_path else None
+    removed = 0
+    for path in glob.glob(os.path.join(output_dir, f"user_{user_id}_*.jpg")):
+        if keep_prefix and os.path.basename(path).startswith(keep_prefix):
+            continue
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
+
+
+class ProfileImagePipeline:
+    """Resizes and re-encodes profile pictures on a worker thread."""
+    
+    # Live instances, so the app can stop every worker on exit
+    _instances: 'weakref.WeakSet[ProfileImagePipeline]' = weakref.WeakSet()
+    
+    def __init__(
+        self,
+        output_dir: str = os.path.join('media', 'profiles'),
+        sizes: Sequence[int] = (150, 300),
+        display_size: int = 300,
+        executor: Optional[Executor] = None
+    ):
+        """Initialize pipeline writing square variants of the given sizes."""
+        self.output_dir = output_dir
+        self.sizes = tuple(sizes)
+        self.display_size = display_size
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix='profile-images')
+        ProfileImagePipeline._instances.add(self)
+    
+    def ingest(
+        self,
+        source: str,
+        user_id: int,
+        on_done: Callable[[Dict[int, str]], None],
+        on_error: Optional[Callable[[Exception], None]] = None
+    ) -> Future:
+        """Process source in the background and report variants on the UI thread."""
+        from kivy.clock import Clock
+        
+        def deliver(future: Future):
+            error = future.exception()
+            if error is None:
+                Clock.schedule_once(lambda dt: on_done(future.result()))
+            elif on_error is not None:
+                Clock.schedule_once(lambda dt: on_error(error))
+        
+        future = self._executor.submit(process_profile_image, source, self.output_dir, user_id, self.sizes)
+        future.add_done_callback(deliver)
+        return future
+    
+    def prune(self, user_id: int, profile_path: str) -> Future:
+        """Delete the user's unused variants once profile_path has been saved."""
+        return self._executor.submit(remove_stale_variants, self.output_dir, user_id, profile_path)
+    
+    def shutdown(self):
+        """Stop the worker; pictures already being written are finished first."""
+        self._executor.shutdown(wait=False)
+        ProfileImagePipeline._instances.discard(self)
+    
+    @classmethod
+    def shutdown_all(cls):
+        """Shut down every live pipeline's worker, e.g. when the app stops."""
+        for pipeline in list(cls._instances):
+            pipeline.shutdown()
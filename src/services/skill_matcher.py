@@ -0,0 +1,210 @@
+"""Skill-match ranking of offers grouped by skill set, found through per-skill posting lists."""
+import heapq
+import threading
+from bisect import insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from database import get_db
+from models import Skill
+from repositories.events import ChangeEvent, EntitiesDeleted, event_bus
+
+
+class SkillMatcher:
+    """Scores only the skill sets sharing a skill with the user, kept current by change events.
+    
+    Offers with the same skills have the same overlap with any user, so overlap is
+    computed once per distinct skill bitset; inside a group offers are ordered by
+    salary, which lets a heap merge the groups and stop after k offers.
+    """
+    
+    def __init__(self, skill_weight: float = 0.85):
+        """Initialize empty index; skill_weight balances overlap against salary."""
+        self.skill_weight = skill_weight
+        self.loaded = False
+        self._skill_bits: Dict[str, int] = {}
+        # Skill bitsets per skill bit: a ranking only visits the lists of the user's skills
+        self._postings: Dict[int, Set[int]] = {}
+        # Skill bitset -> (-salary, -offer id) of its offers, best first
+        self._groups: Dict[int, List[Tuple[float, int]]] = {}
+        # offer id -> (skill bitset, salary)
+        self._offers: Dict[int, Tuple[int, float]] = {}
+        self._salary_range = (0.0, 0.0)
+        # Guards the index: events patch it on writer threads while pool threads rank
+        self._lock = threading.RLock()
+        # Offer writes patch the index in place instead of forcing a rebuild
+        self._unsubscribe = [
+            event_bus.subscribe('offers', self.on_offers_changed),
+            event_bus.subscribe('skills', self.on_skills_deleted, EntitiesDeleted)
+        ]
+    
+    def load(self):
+        """Build the posting lists, bitsets and salaries of every offer from the database."""
+        with self._lock:
+            with get_db() as conn:
+                # One read transaction: both queries see the same snapshot, so every
+                # linked skill id is among the skills read
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                skill_rows = conn.execute("SELECT id, name FROM skills ORDER BY id").fetchall()
+                offer_rows = conn.execute(
+                    "SELECT o.id, o.salary, group_concat(os.skill_id) AS skill_ids "
+                    "FROM offers o LEFT JOIN offer_skills os ON os.offer_id = o.id "
+                    "GROUP BY o.id"
+                ).fetchall()
+            
+            # Dense bit positions keep masks short even when skill ids have gaps
+            bit_by_id = {row['id']: bit for bit, row in enumerate(skill_rows)}
+            self._skill_bits = {row['name'].lower(): bit for bit, row in enumerate(skill_rows)}
+            self._postings = {}
+            self._groups = {}
+            self._offers = {}
+            for row in offer_rows:
+                mask = 0
+                if row['skill_ids']:
+                    for skill_id in row['skill_ids'].split(','):
+                        mask |= 1 << bit_by_id[int(skill_id)]
+                salary = row['salary'] or 0.0
+                self._offers[row['id']] = (mask, salary)
+                self._groups.setdefault(mask, []).append((-salary, -row['id']))
+            for mask, group in self._groups.items():
+                group.sort()
+                self._post_group(mask)
+            self._update_salary_range()
+            self.loaded = True
+    
+    def invalidate(self):
+        """Mark the index stale so the next ranking reloads it."""
+        self.loaded = False
+    
+    def is_stale(self) -> bool:
+        """Tell whether the index must be (re)built before ranking."""
+        return not self.loaded
+    
+    def close(self):
+        """Stop following offer writes."""
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        self._unsubscribe = []
+    
+    def on_offers_changed(self, event: ChangeEvent):
+        """Apply committed offer writes to the index."""
+        with self._lock:
+            # Before the first load there is nothing to patch; load reads the new rows
+            if not self.loaded:
+                return
+            touched = [self._remove_offer(offer_id) for offer_id in event.ids]
+            if not isinstance(event, EntitiesDeleted):
+                for offer in event.models:
+                    mask = 0
+                    for name in Skill.parse(offer.skill_tags):
+                        mask |= 1 << self._bit_for(name)
+                    salary = offer.salary or 0.0
+                    self._put_offer(offer.id, mask, salary)
+                    touched.append(salary)
+            # Salaries strictly inside the range can't move its bounds
+            low, high = self._salary_range
+            if any(salary is not None and not low < salary < high for salary in touched):
+                self._update_salary_range()
+    
+    def on_skills_deleted(self, event: ChangeEvent):
+        """Rebuild on next use: deleting skills cascades to offer links."""
+        self.invalidate()
+    
+    def _bit_for(self, name: str) -> int:
+        """Bit position of a skill name, allocating one for a skill new to the index."""
+        key = name.lower()
+        bit = self._skill_bits.get(key)
+        if bit is None:
+            bit = self._skill_bits[key] = len(self._skill_bits)
+        return bit
+    
+    def _post_group(self, mask: int):
+        """List a skill bitset under each of its skill bits."""
+        for bit in self._bits(mask):
+            self._postings.setdefault(bit, set()).add(mask)
+    
+    @staticmethod
+    def _bits(mask: int) -> List[int]:
+        """Positions of the set bits of mask."""
+        bits = []
+        while mask:
+            low = mask & -mask
+            bits.append(low.bit_length() - 1)
+            mask ^= low
+        return bits
+    
+    def _put_offer(self, offer_id: int, mask: int, salary: float):
+        """Add one offer to the group of its skill bitset."""
+        self._offers[offer_id] = (mask, salary)
+        group = self._groups.get(mask)
+        if group is None:
+            group = self._groups[mask] = []
+            self._post_group(mask)
+        insort(group, (-salary, -offer_id))
+    
+    def _remove_offer(self, offer_id: int) -> Optional[float]:
+        """Drop one offer, and its group once empty; return its salary if it was indexed."""
+        entry = self._offers.pop(offer_id, None)
+        if entry is None:
+            return None
+        mask, salary = entry
+        group = self._groups[mask]
+        group.remove((-salary, -offer_id))
+        if not group:
+            del self._groups[mask]
+            for bit in self._bits(mask):
+                self._postings[bit].discard(mask)
+        return salary
+    
+    def _update_salary_range(self):
+        """Recompute the salary bounds used to normalize salary scores."""
+        salaries = [salary for _, salary in self._offers.values()]
+        self._salary_range = (min(salaries), max(salaries)) if salaries else (0.0, 0.0)
+    
+    def skills_mask(self, skills: Iterable[str]) -> int:
+        """Encode skill names as a bitset; unknown skills cannot match and are ignored."""
+        mask = 0
+        for skill in skills:
+            bit = self._skill_bits.get(skill.strip().lower())
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+    
+    def top_matches(self, skills: Iterable[str], k: int = 50) -> List[Tuple[int, float]]:
+        """Return (offer_id, score) of the k best offers sharing at least one skill."""
+        with self._lock:
+            if self.is_stale():
+                self.load()
+            
+            user_mask = self.skills_mask(skills)
+            if not user_mask:
+                return []
+            
+            user_size = user_mask.bit_count()
+            skill_weight = self.skill_weight
+            low, high = self._salary_range
+            salary_weight = (1.0 - self.skill_weight) / ((high - low) or 1.0)
+            candidates = set().union(*(self._postings.get(bit, ()) for bit in self._bits(user_mask)))
+            
+            # One entry per skill set, keyed by the score of its best paid offer
+            groups = self._groups
+            heap = []
+            append = heap.append
+            for mask in candidates:
+                shared = (mask & user_mask).bit_count()
+                # Jaccard similarity: |A & B| / |A | B| = shared / (|A| + |B| - shared)
+                jaccard_score = skill_weight * shared / (user_size + mask.bit_count() - shared)
+                neg_salary, neg_id = groups[mask][0]
+                append((salary_weight * (neg_salary + low) - jaccard_score, neg_id, jaccard_score, mask, 0))
+            heapq.heapify(heap)
+            
+            matches = []
+            while heap and len(matches) < k:
+                neg_score, neg_id, jaccard_score, mask, index = heapq.heappop(heap)
+                matches.append((-neg_id, -neg_score))
+                group = self._groups[mask]
+                if index + 1 < len(group):
+                    neg_salary, next_id = group[index + 1]
+                    score = jaccard_score - salary_weight * (neg_salary + low)
+                    heapq.heappush(heap, (-score, next_id, jaccard_score, mask, index + 1))
+            return matches
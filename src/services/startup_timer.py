@@ -0,0 +1,30 @@
+"""Cold start timing milestones reported once the first frame is drawn."""
+import time
+from typing import List, Tuple
+
+
+class StartupTimer:
+    """Records named milestones relative to when the timer was created."""
+    
+    def __init__(self):
+        """Start the clock now."""
+        self.started = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+    
+    def mark(self, label: str):
+        """Record that the milestone label was reached."""
+        self.marks.append((label, time.perf_counter()))
+    
+    def report(self) -> str:
+        """Format milestones with elapsed and per-step times in milliseconds."""
+        lines = ['Startup timing:']
+        previous = self.started
+        for label, at in self.marks:
+            lines.append(
+                f"  {label:<24} {(at - self.started) * 1000:8.1f} ms  (+{(at - previous) * 1000:.1f} ms)"
+            )
+            previous = at
+        return '\n'.join(lines)
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,165 @@
+"""Logo thumbnails rendered once to a disk cache keyed by file stat and shared as textures."""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+
+def render_thumbnail(source: str, target: str, size: Tuple[int, int]) -> str:
+    """Decode source once with Pillow and write a downscaled PNG to target."""
+    from PIL import Image, ImageOps
+    
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(size, Image.LANCZOS)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+        # Write then rename so readers never see a half-written file
+        partial = f"{target}.{threading.get_ident()}.tmp"
+        image.save(partial, format='PNG', optimize=True)
+    os.replace(partial, target)
+    return target
+
+
+class ThumbnailService:
+    """Serves logo textures from memory, then disk, generating thumbnails in the background."""
+    
+    def __init__(
+        self,
+        cache_dir: str = os.path.join('cache', 'thumbnails'),
+        size: Tuple[int, int] = (128, 128),
+        max_textures: int = 128,
+        executor: Optional[Executor] = None
+    ):
+        """Initialize caches; thumbnails are rendered by executor, a thread pool by default."""
+        self.cache_dir = cache_dir
+        self.size = size
+        self.max_textures = max_textures
+        self._executor = executor
+        self._textures: 'OrderedDict[str, object]' = OrderedDict()
+        self._pending: Dict[str, List] = {}
+        # Sources that failed to render, by the (mtime_ns, size) they failed at
+        self._failed: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _get_executor(self) -> Executor:
+        """Create the worker pool on first use."""
+        if self._executor is None:
+            # Threads, not processes: Pillow releases the GIL while decoding and
+            # resizing, and worker processes would re-import the app and open
+            # their own Kivy windows (spawn) or inherit its GL context (fork)
+            self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='thumbnails')
+        return self._executor
+    
+    @staticmethod
+    def _signature(source: str) -> Optional[Tuple[int, int]]:
+        """Return (mtime_ns, size) of source, or None if it is missing."""
+        try:
+            stat = os.stat(source)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def thumbnail_path(self, source: str, signature: Optional[Tuple[int, int]] = None) -> str:
+        """Return the cache path for source, named by a hash of its path, mtime and size."""
+        # Hashing stat data instead of file contents keeps this cheap on the UI thread;
+        # replacing the file changes mtime or size and so the name
+        mtime_ns, size = signature or self._signature(source)
+        key = f"{os.path.abspath(source)}\0{mtime_ns}\0{size}"
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        width, height = self.size
+        return os.path.join(self.cache_dir, f"{digest}_{width}x{height}.png")
+    
+    def get_texture(self, source: str):
+        """Return the cached texture for source, or None if not decoded yet."""
+        texture = self._textures.get(source)
+        if texture is not None:
+            self._textures.move_to_end(source)
+        return texture
+    
+    def _store_texture(self, source: str, texture):
+        """Keep texture in the bounded LRU shared by all widgets."""
+        self._textures[source] = texture
+        self._textures.move_to_end(source)
+        while len(self._textures) > self.max_textures:
+            self._textures.popitem(last=False)
+    
+    def bind_texture(self, image, source: str):
+        """Show source's thumbnail in image, never decoding the original on the UI thread."""
+        image._thumbnail_source = source
+        image.texture = None
+        signature = self._signature(source) if source else None
+        if signature is None:
+            return
+        
+        texture = self.get_texture(source)
+        if texture is not None:
+            image.texture = texture
+            return
+        
+        # Broken files are not resubmitted on every rebind until they change
+        if self._failed.get(source) == signature:
+            return
+        
+        target = self.thumbnail_path(source, signature)
+        if os.path.exists(target):
+            self._load_texture(source, target)
+            image.texture = self.get_texture(source)
+            return
+        
+        with self._lock:
+            waiting = self._pending.get(source)
+            if waiting is not None:
+                waiting.append(image)
+                return
+            self._pending[source] = [image]
+        
+        from kivy.clock import Clock
+        
+        future = self._get_executor().submit(render_thumbnail, source, target, self.size)
+        future.add_done_callback(
+            lambda done: Clock.schedule_once(lambda dt: self._on_rendered(source, signature, done))
+        )
+    
+    def _load_texture(self, source: str, target: str):
+        """Decode a small thumbnail file into a texture on the UI thread."""
+        from kivy.core.image import Image as CoreImage
+        
+        self._store_texture(source, CoreImage(target).texture)
+    
+    def _on_rendered(self, source: str, signature: Tuple[int, int], future):
+        """Hand a finished thumbnail to every widget still showing source."""
+        with self._lock:
+            waiting = self._pending.pop(source, [])
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            self._failed[source] = signature
+            return
+        
+        self._load_texture(source, future.result())
+        texture = self.get_texture(source)
+        for image in waiting:
+            # Recycled cards may have been rebound to another logo meanwhile
+            if getattr(image, '_thumbnail_source', None) == source:
+                image.texture = texture
+    
+    def shutdown(self):
+        """Stop the worker pool without waiting for queued thumbnails."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_service: Optional[ThumbnailService] = None
+
+
+def get_thumbnail_service() -> ThumbnailService:
+    """Return the process-wide thumbnail service shared by all cards."""
+    global _service
+    if _service is None:
+        _service = ThumbnailService()
+    return _service
@@ -0,0 +1,112 @@
+"""Lightweight span tracing exported as Chrome trace (about:tracing / Perfetto) JSON."""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+
+class Tracer:
+    """Records timed spans per thread while enabled; a disabled tracer costs one flag check."""
+
+    def __init__(self, max_events: int = 1_000_000):
+        """Initialize a disabled tracer keeping at most max_events spans."""
+        self.enabled = False
+        self.max_events = max_events
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def start(self):
+        """Begin recording, discarding spans of an earlier session."""
+        with self._lock:
+            self._events = []
+            self._threads = {}
+        self._origin = time.perf_counter()
+        self.enabled = True
+
+    def stop(self):
+        """Stop recording; recorded spans stay available for dump."""
+        self.enabled = False
+
+    @contextmanager
+    def span(self, name: str, category: str = 'app', **args):
+        """Time the enclosed block as a span; spans opened inside it nest below it."""
+        if not self.enabled:
+            yield
+            return
+
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, category, started, time.perf_counter(), args)
+
+    def traced(self, name: Optional[str] = None, category: str = 'app') -> Callable:
+        """Decorate a function or method so each call is a span.
+
+        Methods default to a span named after the instance's class, e.g.
+        'OfferRepository.page' for a method inherited from BaseRepository.
+        """
+        def decorate(function: Callable) -> Callable:
+            is_method = '.' in function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                if name is not None:
+                    label = name
+                elif is_method and args:
+                    label = f"{type(args[0]).__name__}.{function.__name__}"
+                else:
+                    label = function.__qualname__
+
+                started = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self._record(label, category, started, time.perf_counter(), None)
+            return wrapper
+        return decorate
+
+    def _record(self, name: str, category: str, started: float, ended: float, args: Optional[dict]):
+        """Store one finished span as a Chrome 'complete' event."""
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': (started - self._origin) * 1e6,
+            'dur': (ended - started) * 1e6,
+            'pid': os.getpid(),
+            'tid': thread.ident
+        }
+        if args:
+            event['args'] = {key: str(value) for key, value in args.items()}
+        with self._lock:
+            if len(self._events) < self.max_events:
+                self._events.append(event)
+                self._threads.setdefault(thread.ident, thread.name)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Recorded spans plus thread names in Chrome trace event format."""
+        with self._lock:
+            events = list(self._events)
+            threads = dict(self._threads)
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': ident, 'args': {'name': label}}
+            for ident, label in threads.items()
+        ]
+        return {'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}
+
+    def dump(self, path: str):
+        """Write the trace to path; open it in chrome://tracing or ui.perfetto.dev."""
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump(self.to_dict(), handle)
+
+
+tracer = Tracer()